@@ -82,8 +82,10 @@ vector<PackageInfo> AptBackend::searchPackages(
         return results;
     }
 
-    // Use existing Synaptic search functionality
-    // limitBySearch() sets up the filter and populates _viewPackages
+    // Use existing Synaptic search functionality.
+    // limitBySearch() sets up the filter and populates _viewPackages;
+    // always re-limit because the UI shares this lister and may have
+    // changed the view since our last call.
     if (!options.query.empty()) {
         _lister->limitBySearch(options.query);
     }
@@ -134,14 +136,49 @@ vector<PackageInfo> AptBackend::getInstalledPackages(
     int total = _lister->packagesSize();
     int current = 0;
 
+    // Rough guess to avoid repeated growth; a typical system has far
+    // fewer installed packages than the cache knows about
+    results.reserve(total / 8);
+
     for (int i = 0; i < total; i++) {
         RPackage* pkg = _lister->getPackage(i);
         if (!pkg) continue;
 
         int flags = pkg->getFlags();
         if (flags & RPackage::FInstalled) {
-            PackageInfo info = rpackageToPackageInfo(pkg);
-            results.push_back(info);
+            // Build a trimmed PackageInfo inline. The record-backed
+            // detail fields (description, homepage, maintainer) cost a
+            // pkgRecords lookup per package and are only shown by the
+            // details view, which goes through getPackageDetails().
+            PackageInfo info;
+            info.backend = BackendType::APT;
+            info.id = pkg->name();
+            info.name = pkg->name();
+
+            const char* summary = pkg->summary();
+            info.summary = summary ? summary : "";
+
+            const char* availVer = pkg->availableVersion();
+            info.version = availVer ? availVer : "";
+
+            const char* instVer = pkg->installedVersion();
+            info.installedVersion = instVer ? instVer : "";
+
+            info.installStatus = flagsToInstallStatus(flags);
+
+            const char* section = pkg->section();
+            info.section = section ? section : "";
+
+            info.downloadSize = pkg->availablePackageSize();
+            info.installedSize = pkg->availableInstalledSize();
+            info.origin = pkg->origin();
+            info.architecture = pkg->arch();
+
+            info.isMarkedForInstall = (flags & RPackage::FInstall) != 0;
+            info.isMarkedForRemoval = (flags & RPackage::FRemove) != 0;
+            info.isMarkedForUpgrade = (flags & RPackage::FUpgrade) != 0;
+
+            results.push_back(std::move(info));
         }
 
         // Report progress periodically
@@ -353,16 +390,9 @@ RPackage* AptBackend::findPackageByName(const string& name)
 {
     if (!_lister) return nullptr;
 
-    // Search through all packages
-    int total = _lister->packagesSize();
-    for (int i = 0; i < total; i++) {
-        RPackage* pkg = _lister->getPackage(i);
-        if (pkg && pkg->name() == name) {
-            return pkg;
-        }
-    }
-
-    return nullptr;
+    // The lister's FindPkg-based lookup is already O(1) and always
+    // reflects the current cache, so there is nothing to index here
+    return _lister->getPackage(name);
 }
 
 PackageInfo AptBackend::rpackageToPackageInfo(RPackage* pkg)
@@ -530,12 +560,16 @@ InstallStatus AptBackend::flagsToInstallStatus(int flags)
     return InstallStatus::NOT_INSTALLED;
 }
 
+// Compiled once at load time; the function-local static form pays a
+// thread-safe initialization guard check on every call.
+//
+// APT package names: lowercase letters, digits, +, -, . (must start
+// with alnum). Security: the pattern also prevents command injection.
+static const regex kValidPackageName("^[a-z0-9][a-z0-9+.-]*$");
+
 bool AptBackend::isValidPackageName(const string& name)
 {
-    // APT package names: lowercase letters, digits, +, -, . (must start with alnum)
-    // Security: Prevent command injection by validating input
-    static const regex validName("^[a-z0-9][a-z0-9+.-]*$");
-    return regex_match(name, validName);
+    return regex_match(name, kValidPackageName);
 }
 
 } // namespace PolySynaptic
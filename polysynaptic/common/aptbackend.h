@@ -170,6 +170,9 @@ public:
      */
     OperationResult fixBroken();
 
+    // Validation (public so tests can exercise it directly)
+    bool isValidPackageName(const string& name);
+
 private:
     RPackageLister* _lister;        // Borrowed reference (not owned)
     mutable mutex _mutex;           // Thread safety lock
@@ -178,8 +181,6 @@ private:
     // Helper to get package flags as InstallStatus
     InstallStatus flagsToInstallStatus(int flags);
 
-    // Helper to validate package name (prevent injection)
-    bool isValidPackageName(const string& name);
 };
 
 } // namespace PolySynaptic
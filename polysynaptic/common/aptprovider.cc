@@ -103,12 +103,18 @@ std::vector<UnifiedPackage> APTProvider::search(
     std::regex queryRegex;
     bool useRegex = false;
 
-    try {
-        queryRegex = std::regex(query, std::regex::icase);
-        useRegex = true;
-    } catch (...) {
-        // Invalid regex, use substring matching
-        useRegex = false;
+    // Only compile a regex when the query actually uses regex syntax.
+    // Plain queries (the common case) take the substring path below,
+    // avoiding both the regex construction and the per-package
+    // regex_search over the whole cache.
+    if (query.find_first_of(".*+?[](){}|^$\\") != std::string::npos) {
+        try {
+            queryRegex = std::regex(query, std::regex::icase);
+            useRegex = true;
+        } catch (...) {
+            // Invalid regex, use substring matching
+            useRegex = false;
+        }
     }
 
     std::string lowerQuery = query;
@@ -14,6 +14,7 @@
 #include <fstream>
 #include <algorithm>
 #include <chrono>
+#include <iterator>
 
 namespace PolySynaptic {
 
@@ -26,12 +27,17 @@ BackendManager::BackendManager(RPackageLister* lister)
     , _snapEnabled(true)
     , _flatpakEnabled(true)
 {
-    initializeBackends(lister);
+    // Read the enable flags first so backends the user disabled skip
+    // their availability warm-up in initializeBackends
     loadConfiguration();
+    initializeBackends(lister);
 }
 
 BackendManager::~BackendManager()
 {
+    if (_availabilityWarmup.valid()) {
+        _availabilityWarmup.wait();
+    }
     saveConfiguration();
 }
 
@@ -48,6 +54,19 @@ void BackendManager::initializeBackends(RPackageLister* lister)
     // Initialize Flatpak backend
     _flatpakBackend = make_unique<FlatpakBackend>();
 
+    // Warm the CLI backends' availability caches off the caller's
+    // thread: both memoize their first probe internally, so by the time
+    // the UI asks isAvailable() the answer is usually already cached.
+    // Disabled backends are constructed (so they still show up in the
+    // preferences panel) but not probed; re-enabling one pays the
+    // fork-free probe cost on its first isAvailable() call instead.
+    SnapBackend* snap = _snapEnabled ? _snapBackend.get() : nullptr;
+    FlatpakBackend* flatpak = _flatpakEnabled ? _flatpakBackend.get() : nullptr;
+    _availabilityWarmup = async(launch::async, [snap, flatpak]() {
+        if (snap) snap->isAvailable();
+        if (flatpak) flatpak->isAvailable();
+    });
+
     // Detect availability
     detectBackendAvailability();
 }
@@ -209,6 +228,9 @@ void BackendManager::setBackendEnabled(BackendType type, bool enabled)
             break;
     }
 
+    // Memoized search results were combined from the old backend set
+    invalidateSearchMemo();
+
     saveConfiguration();
 }
 
@@ -246,6 +268,33 @@ vector<PackageInfo> BackendManager::searchPackages(
         return results;
     }
 
+    // Memo lookup: the same query with the same options and filter
+    // within the TTL reuses the previous combined results instead of
+    // re-running the whole backend fan-out
+    string memoKey = options.query;
+    memoKey += '|';
+    memoKey += options.searchNames ? 'n' : '-';
+    memoKey += options.searchDescriptions ? 'd' : '-';
+    memoKey += options.installedOnly ? 'i' : '-';
+    memoKey += options.availableOnly ? 'a' : '-';
+    memoKey += to_string(options.maxResults);
+    memoKey += '|';
+    memoKey += filter.includeApt ? 'A' : '-';
+    memoKey += filter.includeSnap ? 'S' : '-';
+    memoKey += filter.includeFlatpak ? 'F' : '-';
+
+    auto memoIt = _searchMemo.find(memoKey);
+    if (memoIt != _searchMemo.end()) {
+        auto age = chrono::steady_clock::now() - memoIt->second.first;
+        if (age < chrono::seconds(SEARCH_MEMO_TTL_SECONDS)) {
+            if (progress) {
+                progress(1.0, "Found " + to_string(memoIt->second.second.size()) + " packages");
+            }
+            return memoIt->second.second;
+        }
+        _searchMemo.erase(memoIt);
+    }
+
     // Launch parallel searches
     // Note: We capture options by value to ensure it remains valid even if
     // the caller's stack frame changes. Backend pointers are guaranteed valid
@@ -296,6 +345,13 @@ vector<PackageInfo> BackendManager::searchPackages(
         results.resize(options.maxResults);
     }
 
+    // Store under the memo key; clearing wholesale at the cap keeps the
+    // bookkeeping trivial for such a small cache
+    if (_searchMemo.size() >= SEARCH_MEMO_MAX) {
+        _searchMemo.clear();
+    }
+    _searchMemo[memoKey] = {chrono::steady_clock::now(), results};
+
     if (progress) {
         progress(1.0, "Found " + to_string(results.size()) + " packages");
     }
@@ -311,25 +367,42 @@ vector<PackageInfo> BackendManager::getInstalledPackages(
     vector<PackageInfo> results;
 
     auto backends = getEnabledBackends();
-    int current = 0;
-    int total = backends.size();
 
+    vector<IPackageBackend*> filteredBackends;
     for (auto* backend : backends) {
-        if (!filter.includes(backend->getType())) {
-            continue;
+        if (filter.includes(backend->getType())) {
+            filteredBackends.push_back(backend);
         }
+    }
 
-        if (progress) {
-            double pct = static_cast<double>(current) / total;
-            if (!progress(pct, "Loading " + backend->getName() + " packages...")) {
-                break;
-            }
-        }
+    if (filteredBackends.empty()) {
+        return results;
+    }
 
-        auto pkgs = backend->getInstalledPackages(nullptr);
-        results.insert(results.end(), pkgs.begin(), pkgs.end());
+    if (progress) {
+        progress(0.0, "Loading installed packages...");
+    }
 
-        current++;
+    // Each backend blocks on its own CLI/cache I/O, so run them in
+    // parallel like searchPackages does; wall time becomes the slowest
+    // backend instead of the sum. Backend pointers stay valid because
+    // we hold _mutex.
+    vector<future<vector<PackageInfo>>> futures;
+    for (auto* backend : filteredBackends) {
+        futures.push_back(async(launch::async, [backend]() {
+            return backend->getInstalledPackages(nullptr);
+        }));
+    }
+
+    for (auto& future : futures) {
+        try {
+            auto pkgs = future.get();
+            results.insert(results.end(),
+                           make_move_iterator(pkgs.begin()),
+                           make_move_iterator(pkgs.end()));
+        } catch (const exception& e) {
+            // Log error but continue
+        }
     }
 
     if (progress) {
@@ -347,25 +420,41 @@ vector<PackageInfo> BackendManager::getUpgradablePackages(
     vector<PackageInfo> results;
 
     auto backends = getEnabledBackends();
-    int current = 0;
-    int total = backends.size();
 
+    vector<IPackageBackend*> filteredBackends;
     for (auto* backend : backends) {
-        if (!filter.includes(backend->getType())) {
-            continue;
+        if (filter.includes(backend->getType())) {
+            filteredBackends.push_back(backend);
         }
+    }
 
-        if (progress) {
-            double pct = static_cast<double>(current) / total;
-            if (!progress(pct, "Checking " + backend->getName() + " updates...")) {
-                break;
-            }
-        }
+    if (filteredBackends.empty()) {
+        return results;
+    }
 
-        auto pkgs = backend->getUpgradablePackages(nullptr);
-        results.insert(results.end(), pkgs.begin(), pkgs.end());
+    if (progress) {
+        progress(0.0, "Checking for updates...");
+    }
 
-        current++;
+    // Same fan-out as getInstalledPackages: every backend's update check
+    // is subprocess- or cache-bound, so total wall time should be the
+    // slowest backend, not the sum
+    vector<future<vector<PackageInfo>>> futures;
+    for (auto* backend : filteredBackends) {
+        futures.push_back(async(launch::async, [backend]() {
+            return backend->getUpgradablePackages(nullptr);
+        }));
+    }
+
+    for (auto& future : futures) {
+        try {
+            auto pkgs = future.get();
+            results.insert(results.end(),
+                           make_move_iterator(pkgs.begin()),
+                           make_move_iterator(pkgs.end()));
+        } catch (const exception& e) {
+            // Log error but continue
+        }
     }
 
     if (progress) {
@@ -601,6 +690,10 @@ TransactionResult BackendManager::commitTransaction(ProgressCallback progress)
     // Clear completed transaction
     _currentTransaction.clear();
 
+    // Installed/available state changed, so memoized search results
+    // are stale
+    invalidateSearchMemo();
+
     if (progress) {
         progress(1.0, result.getSummary());
     }
@@ -701,6 +794,9 @@ OperationResult BackendManager::refreshAllCaches(ProgressCallback progress)
         current++;
     }
 
+    // Fresh backend caches invalidate memoized search results
+    invalidateSearchMemo();
+
     if (progress) {
         progress(1.0, "Cache refresh complete");
     }
@@ -712,6 +808,12 @@ OperationResult BackendManager::refreshAllCaches(ProgressCallback progress)
     return OperationResult::Success("All caches refreshed");
 }
 
+void BackendManager::invalidateSearchMemo()
+{
+    lock_guard<mutex> lock(_mutex);
+    _searchMemo.clear();
+}
+
 // ============================================================================
 // Configuration
 // ============================================================================
@@ -772,12 +874,19 @@ void BackendManager::saveConfiguration(const string& path)
         return;
     }
 
-    file << "# PolySynaptic Configuration\n";
-    file << "# Generated automatically\n\n";
+    // Assemble the whole file and write it in one go rather than one
+    // stream insertion per setting
+    string content = "# PolySynaptic Configuration\n"
+                     "# Generated automatically\n\n";
+    content += "apt_enabled=";
+    content += _aptEnabled ? "true" : "false";
+    content += "\nsnap_enabled=";
+    content += _snapEnabled ? "true" : "false";
+    content += "\nflatpak_enabled=";
+    content += _flatpakEnabled ? "true" : "false";
+    content += '\n';
 
-    file << "apt_enabled=" << (_aptEnabled ? "true" : "false") << "\n";
-    file << "snap_enabled=" << (_snapEnabled ? "true" : "false") << "\n";
-    file << "flatpak_enabled=" << (_flatpakEnabled ? "true" : "false") << "\n";
+    file.write(content.data(), content.size());
 }
 
 void BackendManager::notifyTransactionChanged()
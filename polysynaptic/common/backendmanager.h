@@ -33,6 +33,7 @@
 #include <thread>
 #include <future>
 #include <atomic>
+#include <chrono>
 
 // Forward declaration in global namespace (RPackageLister is a legacy Synaptic class)
 class RPackageLister;
@@ -47,13 +48,13 @@ namespace PolySynaptic {
  */
 struct Transaction {
     struct Operation {
-        BackendType backend;
+        enum class Type { INSTALL, REMOVE, UPDATE };
+
+        BackendType backend = BackendType::UNKNOWN;
         string packageId;
         string packageName;
-        enum class Type { INSTALL, REMOVE, UPDATE } type;
-        bool purge;  // For removals
-
-        Operation() : backend(BackendType::UNKNOWN), type(Type::INSTALL), purge(false) {}
+        Type type = Type::INSTALL;
+        bool purge = false;  // For removals
     };
 
     vector<Operation> operations;
@@ -89,11 +90,9 @@ struct TransactionResult {
  * BackendFilter - Filter for selecting which backends to query
  */
 struct BackendFilter {
-    bool includeApt;
-    bool includeSnap;
-    bool includeFlatpak;
-
-    BackendFilter() : includeApt(true), includeSnap(true), includeFlatpak(true) {}
+    bool includeApt = true;
+    bool includeSnap = true;
+    bool includeFlatpak = true;
 
     static BackendFilter All() { return BackendFilter(); }
 
@@ -374,6 +373,19 @@ private:
     BackendStatusCallback _statusCallback;
     TransactionChangedCallback _txCallback;
 
+    // Background availability warm-up launched at construction; joined
+    // in the destructor so the probe never outlives the backends
+    future<void> _availabilityWarmup;
+
+    // Short-lived memo of combined search results keyed on query plus
+    // options/filter flags; a repeated query (re-typed term, UI refresh)
+    // skips the whole backend fan-out. Dropped wholesale after cache
+    // refreshes and committed transactions.
+    static constexpr int SEARCH_MEMO_TTL_SECONDS = 30;
+    static constexpr size_t SEARCH_MEMO_MAX = 32;
+    map<string, pair<chrono::steady_clock::time_point, vector<PackageInfo>>> _searchMemo;
+    void invalidateSearchMemo();
+
     // Initialization
     void initializeBackends(RPackageLister* lister);
     void detectBackendAvailability();
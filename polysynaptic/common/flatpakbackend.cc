@@ -17,6 +17,7 @@
 #include <fcntl.h>
 #include <poll.h>
 
+#include <cstdlib>
 #include <cstring>
 #include <sstream>
 #include <regex>
@@ -25,6 +26,32 @@
 
 namespace PolySynaptic {
 
+// ============================================================================
+// Helpers
+// ============================================================================
+
+// Check whether a command exists by scanning $PATH with access(X_OK).
+// Much cheaper than forking `which`: a few stat-like syscalls instead of
+// fork + exec + wait.
+static bool commandInPath(const string& cmd)
+{
+    const char* pathEnv = getenv("PATH");
+    if (pathEnv == nullptr) {
+        return false;
+    }
+
+    istringstream iss(pathEnv);
+    string dir;
+    while (getline(iss, dir, ':')) {
+        if (dir.empty()) continue;
+        string candidate = dir + "/" + cmd;
+        if (access(candidate.c_str(), X_OK) == 0) {
+            return true;
+        }
+    }
+    return false;
+}
+
 // ============================================================================
 // Constructor / Destructor
 // ============================================================================
@@ -32,6 +59,7 @@ namespace PolySynaptic {
 FlatpakBackend::FlatpakBackend()
     : _availabilityChecked(false)
     , _isAvailable(false)
+    , _installedIdsValid(false)
     , _defaultScope(Scope::USER)
     , _defaultRemote("flathub")
     , _timeoutSeconds(120)
@@ -61,6 +89,27 @@ string FlatpakBackend::getUnavailableReason() const
 string FlatpakBackend::getVersion() const
 {
     checkAvailability();
+    if (!_isAvailable) {
+        return "";
+    }
+
+    // Probe lazily: most callers only need isAvailable(), so the
+    // `flatpak --version` spawn is deferred until someone actually asks.
+    lock_guard<mutex> lock(_mutex);
+    if (_version.empty()) {
+        auto result = executeCommand({"flatpak", "--version"}, 10);
+        if (result.success && result.exitCode == 0) {
+            // Output: "Flatpak 1.14.1"
+            size_t pos = result.stdout.rfind(' ');
+            if (pos != string::npos) {
+                _version = result.stdout.substr(pos + 1);
+                // Remove trailing newline
+                while (!_version.empty() && (_version.back() == '\n' || _version.back() == '\r')) {
+                    _version.pop_back();
+                }
+            }
+        }
+    }
     return _version;
 }
 
@@ -76,9 +125,8 @@ void FlatpakBackend::checkAvailability() const
     // Note: We set this to true AFTER initialization completes (at end of function)
     // to ensure all data is visible to other threads
 
-    // Check if flatpak command exists
-    auto result = executeCommand({"which", "flatpak"}, 5);
-    if (!result.success || result.exitCode != 0) {
+    // Check if flatpak command exists (PATH scan, no subprocess)
+    if (!commandInPath("flatpak")) {
         _isAvailable = false;
         _unavailableReason = "flatpak command not found. Install flatpak to enable Flatpak support.";
         // Use release memory order to ensure all writes are visible
@@ -86,20 +134,8 @@ void FlatpakBackend::checkAvailability() const
         return;
     }
 
-    // Get version
-    result = executeCommand({"flatpak", "--version"}, 10);
-    if (result.success && result.exitCode == 0) {
-        // Output: "Flatpak 1.14.1"
-        size_t pos = result.stdout.rfind(' ');
-        if (pos != string::npos) {
-            _version = result.stdout.substr(pos + 1);
-            // Remove trailing newline
-            while (!_version.empty() && (_version.back() == '\n' || _version.back() == '\r')) {
-                _version.pop_back();
-            }
-        }
-    }
-
+    // Version is probed lazily in getVersion(); the only spawn the
+    // availability check still pays for is the remotes listing below.
     // Check if any remotes are configured
     refreshRemotesCache();
     if (_remotes.empty()) {
@@ -116,7 +152,9 @@ void FlatpakBackend::checkAvailability() const
 
 void FlatpakBackend::refreshRemotesCache() const
 {
-    auto result = executeCommand({"flatpak", "remotes", "--columns=name"}, 30);
+    // Short timeout: listing remotes is a local config read, and this
+    // runs inside the availability probe that can block the UI
+    auto result = executeCommand({"flatpak", "remotes", "--columns=name"}, 5);
     _remotes.clear();
 
     if (result.success && result.exitCode == 0) {
@@ -240,7 +278,9 @@ vector<PackageInfo> FlatpakBackend::getInstalledPackages(
 
     if (userResult.success && userResult.exitCode == 0) {
         auto userApps = parseFlatpakList(userResult.stdout);
-        results.insert(results.end(), userApps.begin(), userApps.end());
+        results.insert(results.end(),
+                       make_move_iterator(userApps.begin()),
+                       make_move_iterator(userApps.end()));
     }
 
     if (systemResult.success && systemResult.exitCode == 0) {
@@ -252,7 +292,7 @@ vector<PackageInfo> FlatpakBackend::getInstalledPackages(
         }
         for (auto& pkg : systemApps) {
             if (userIds.count(pkg.id) == 0) {
-                results.push_back(pkg);
+                results.push_back(std::move(pkg));
             }
         }
     }
@@ -272,6 +312,17 @@ PackageInfo FlatpakBackend::getPackageDetails(const string& packageId)
         return info;
     }
 
+    // Serve repeated queries for the same app from the details cache
+    {
+        lock_guard<mutex> lock(_mutex);
+        auto it = _detailsCache.find(packageId);
+        if (it != _detailsCache.end() &&
+            chrono::steady_clock::now() - it->second.first <
+                chrono::seconds(DETAILS_TTL_SECONDS)) {
+            return it->second.second;
+        }
+    }
+
     // Try user first, then system
     auto result = executeCommand({"flatpak", "info", "--user", packageId}, _timeoutSeconds);
 
@@ -292,6 +343,12 @@ PackageInfo FlatpakBackend::getPackageDetails(const string& packageId)
 
     if (result.success && result.exitCode == 0) {
         info = parseFlatpakInfo(result.stdout, packageId);
+
+        lock_guard<mutex> lock(_mutex);
+        if (_detailsCache.size() >= DETAILS_CACHE_MAX) {
+            _detailsCache.clear();
+        }
+        _detailsCache[packageId] = {chrono::steady_clock::now(), info};
     }
 
     return info;
@@ -303,14 +360,12 @@ InstallStatus FlatpakBackend::getInstallStatus(const string& packageId)
         return InstallStatus::UNKNOWN;
     }
 
-    // Check if installed (user or system)
-    auto result = executeCommand({"flatpak", "info", "--user", packageId}, 30);
-    if (result.success && result.exitCode == 0) {
-        return InstallStatus::INSTALLED;
-    }
+    // Answer from the cached installed-id set; one `flatpak list`
+    // populates it for all subsequent lookups
+    loadInstalledIdsCache();
 
-    result = executeCommand({"flatpak", "info", "--system", packageId}, 30);
-    if (result.success && result.exitCode == 0) {
+    lock_guard<mutex> lock(_mutex);
+    if (_installedIds.count(packageId) > 0) {
         return InstallStatus::INSTALLED;
     }
 
@@ -368,6 +423,49 @@ vector<PackageInfo> FlatpakBackend::getUpgradablePackages(
     return results;
 }
 
+// ============================================================================
+// Installed App-ID Cache
+// ============================================================================
+
+void FlatpakBackend::loadInstalledIdsCache() const
+{
+    lock_guard<mutex> lock(_mutex);
+    if (_installedIdsValid) {
+        return;
+    }
+
+    // One `flatpak list` covers both user and system installations
+    auto result = executeCommand({"flatpak", "list", "--columns=application"}, 30);
+
+    if (!result.success || result.exitCode != 0) {
+        // Don't cache a failed listing as an empty installed set; leave
+        // the cache invalid so the next lookup retries
+        return;
+    }
+
+    _installedIds.clear();
+    istringstream iss(result.stdout);
+    string line;
+    while (getline(iss, line)) {
+        while (!line.empty() &&
+               (line.back() == '\r' || line.back() == ' ' || line.back() == '\t')) {
+            line.pop_back();
+        }
+        if (!line.empty()) {
+            _installedIds.insert(line);
+        }
+    }
+
+    _installedIdsValid = true;
+}
+
+void FlatpakBackend::invalidateInstalledIdsCache() const
+{
+    lock_guard<mutex> lock(_mutex);
+    _installedIdsValid = false;
+    _detailsCache.clear();
+}
+
 // ============================================================================
 // Package Operations
 // ============================================================================
@@ -434,6 +532,14 @@ OperationResult FlatpakBackend::installFlatpak(
     }
 
     if (result.success && result.exitCode == 0) {
+        // Keep the installed-id cache in sync, drop stale details
+        {
+            lock_guard<mutex> lock(_mutex);
+            if (_installedIdsValid) {
+                _installedIds.insert(appId);
+            }
+            _detailsCache.erase(appId);
+        }
         return OperationResult::Success("Successfully installed " + appId);
     } else {
         return OperationResult::Failure(
@@ -484,6 +590,14 @@ OperationResult FlatpakBackend::removePackage(
     }
 
     if (result.success && result.exitCode == 0) {
+        // Keep the installed-id cache in sync, drop stale details
+        {
+            lock_guard<mutex> lock(_mutex);
+            if (_installedIdsValid) {
+                _installedIds.erase(packageId);
+            }
+            _detailsCache.erase(packageId);
+        }
         return OperationResult::Success("Successfully removed " + packageId);
     } else {
         return OperationResult::Failure(
@@ -525,6 +639,10 @@ OperationResult FlatpakBackend::updatePackage(
     }
 
     if (result.success && result.exitCode == 0) {
+        {
+            lock_guard<mutex> lock(_mutex);
+            _detailsCache.erase(packageId);
+        }
         return OperationResult::Success("Successfully updated " + packageId);
     } else {
         return OperationResult::Failure(
@@ -547,8 +665,9 @@ OperationResult FlatpakBackend::refreshCache(ProgressCallback progress)
     // Update appstream data from all remotes
     auto result = executeCommand({"flatpak", "update", "--appstream"}, _timeoutSeconds);
 
-    // Refresh our cached remotes list
+    // Refresh our cached remotes list and drop the installed-id cache
     refreshRemotesCache();
+    invalidateInstalledIdsCache();
 
     if (progress) {
         progress(1.0, "Flatpak data refreshed");
@@ -823,14 +942,13 @@ FlatpakBackend::CommandResult FlatpakBackend::executeCommand(
         int ret = poll(fds, 2, pollTimeout);
 
         if (ret > 0) {
-            char buffer[4096];
+            char buffer[65536];  // large reads mean fewer read() wakeups for chatty commands
 
             if (fds[0].revents & POLLIN) {
-                ssize_t n = read(stdoutPipe[0], buffer, sizeof(buffer) - 1);
+                ssize_t n = read(stdoutPipe[0], buffer, sizeof(buffer));
                 if (n > 0 && !outputTruncated) {
-                    buffer[n] = '\0';
                     if (result.stdout.size() + n < MAX_OUTPUT_SIZE) {
-                        result.stdout += buffer;
+                        result.stdout.append(buffer, n);
                     } else {
                         outputTruncated = true;
                         result.stdout += "\n... output truncated (exceeded 10MB limit) ...";
@@ -839,11 +957,10 @@ FlatpakBackend::CommandResult FlatpakBackend::executeCommand(
             }
 
             if (fds[1].revents & POLLIN) {
-                ssize_t n = read(stderrPipe[0], buffer, sizeof(buffer) - 1);
+                ssize_t n = read(stderrPipe[0], buffer, sizeof(buffer));
                 if (n > 0 && !outputTruncated) {
-                    buffer[n] = '\0';
                     if (result.stderr.size() + n < MAX_OUTPUT_SIZE) {
-                        result.stderr += buffer;
+                        result.stderr.append(buffer, n);
                     } else {
                         outputTruncated = true;
                         result.stderr += "\n... output truncated (exceeded 10MB limit) ...";
@@ -856,18 +973,16 @@ FlatpakBackend::CommandResult FlatpakBackend::executeCommand(
         pid_t w = waitpid(pid, &status, WNOHANG);
         if (w > 0) {
             // Read any remaining output
-            char buffer[4096];
+            char buffer[65536];  // large reads mean fewer read() wakeups for chatty commands
             ssize_t n;
-            while ((n = read(stdoutPipe[0], buffer, sizeof(buffer) - 1)) > 0) {
+            while ((n = read(stdoutPipe[0], buffer, sizeof(buffer))) > 0) {
                 if (!outputTruncated && result.stdout.size() + n < MAX_OUTPUT_SIZE) {
-                    buffer[n] = '\0';
-                    result.stdout += buffer;
+                    result.stdout.append(buffer, n);
                 }
             }
-            while ((n = read(stderrPipe[0], buffer, sizeof(buffer) - 1)) > 0) {
+            while ((n = read(stderrPipe[0], buffer, sizeof(buffer))) > 0) {
                 if (!outputTruncated && result.stderr.size() + n < MAX_OUTPUT_SIZE) {
-                    buffer[n] = '\0';
-                    result.stderr += buffer;
+                    result.stderr.append(buffer, n);
                 }
             }
 
@@ -909,40 +1024,77 @@ FlatpakBackend::CommandResult FlatpakBackend::executeCommand(
 // Parsing Helpers
 // ============================================================================
 
+// Split a tab-separated line into columns. A direct scan over the line
+// instead of an istringstream per line - the parsers run over thousands
+// of rows and the stream construction dominated.
+static vector<string> splitTabs(const string& line)
+{
+    vector<string> cols;
+    size_t start = 0;
+    while (true) {
+        size_t tab = line.find('\t', start);
+        if (tab == string::npos) {
+            cols.push_back(line.substr(start));
+            break;
+        }
+        cols.push_back(line.substr(start, tab - start));
+        start = tab + 1;
+    }
+    return cols;
+}
+
+// Extract the next line of `output` starting at `pos`, advancing `pos`
+// past the newline. Returns false when the input is exhausted.
+static bool nextLine(const string& output, size_t& pos, string& line)
+{
+    if (pos >= output.size()) {
+        return false;
+    }
+    size_t eol = output.find('\n', pos);
+    if (eol == string::npos) {
+        line.assign(output, pos, output.size() - pos);
+        pos = output.size();
+    } else {
+        line.assign(output, pos, eol - pos);
+        pos = eol + 1;
+    }
+    return true;
+}
+
 vector<PackageInfo> FlatpakBackend::parseFlatpakSearch(const string& output)
 {
     vector<PackageInfo> results;
 
+    // One slot per line is a slight overestimate (header row) but
+    // avoids repeated reallocation on large outputs
+    results.reserve(count(output.begin(), output.end(), '\n'));
+
     /*
      * flatpak search --columns=application,name,description,version,remotes output:
      * org.gnome.Calculator	Calculator	Perform calculations	42.1	flathub
      */
 
-    istringstream iss(output);
+    size_t pos = 0;
     string line;
 
-    while (getline(iss, line)) {
+    while (nextLine(output, pos, line)) {
         if (line.empty()) continue;
 
-        // Tab-separated columns
-        vector<string> cols;
-        istringstream lineStream(line);
-        string col;
-        while (getline(lineStream, col, '\t')) {
-            cols.push_back(col);
-        }
+        vector<string> cols = splitTabs(line);
 
         if (cols.size() >= 4) {
             PackageInfo info;
             info.backend = BackendType::FLATPAK;
-            info.id = cols[0];
-            info.name = cols.size() > 1 ? cols[1] : cols[0];
-            info.summary = cols.size() > 2 ? cols[2] : "";
-            info.version = cols.size() > 3 ? cols[3] : "";
-            info.remote = cols.size() > 4 ? cols[4] : "";
+            info.name = std::move(cols[1]);
+            info.summary = std::move(cols[2]);
+            info.version = std::move(cols[3]);
+            if (cols.size() > 4) {
+                info.remote = std::move(cols[4]);
+            }
+            info.id = std::move(cols[0]);
             info.installStatus = InstallStatus::NOT_INSTALLED;
 
-            results.push_back(info);
+            results.push_back(std::move(info));
         }
     }
 
@@ -953,33 +1105,36 @@ vector<PackageInfo> FlatpakBackend::parseFlatpakList(const string& output)
 {
     vector<PackageInfo> results;
 
+    // One slot per line is a slight overestimate (header row) but
+    // avoids repeated reallocation on large outputs
+    results.reserve(count(output.begin(), output.end(), '\n'));
+
     /*
      * flatpak list --columns=application,name,version,branch,origin,size:
      * org.gnome.Calculator	Calculator	42.1	stable	flathub	98.7 MB
      */
 
-    istringstream iss(output);
+    size_t pos = 0;
     string line;
 
-    while (getline(iss, line)) {
+    while (nextLine(output, pos, line)) {
         if (line.empty()) continue;
 
-        vector<string> cols;
-        istringstream lineStream(line);
-        string col;
-        while (getline(lineStream, col, '\t')) {
-            cols.push_back(col);
-        }
+        vector<string> cols = splitTabs(line);
 
         if (cols.size() >= 2) {
             PackageInfo info;
             info.backend = BackendType::FLATPAK;
-            info.id = cols[0];
-            info.name = cols.size() > 1 ? cols[1] : cols[0];
-            info.version = cols.size() > 2 ? cols[2] : "";
+            info.name = std::move(cols[1]);
+            if (cols.size() > 2) {
+                info.version = std::move(cols[2]);
+            }
             info.installedVersion = info.version;
-            info.branch = cols.size() > 3 ? cols[3] : "stable";
-            info.remote = cols.size() > 4 ? cols[4] : "";
+            info.branch = cols.size() > 3 ? std::move(cols[3]) : "stable";
+            if (cols.size() > 4) {
+                info.remote = std::move(cols[4]);
+            }
+            info.id = std::move(cols[0]);
             info.installStatus = InstallStatus::INSTALLED;
 
             // Parse size if available
@@ -989,7 +1144,7 @@ vector<PackageInfo> FlatpakBackend::parseFlatpakList(const string& output)
                 // TODO: Convert to bytes
             }
 
-            results.push_back(info);
+            results.push_back(std::move(info));
         }
     }
 
@@ -1122,29 +1277,34 @@ vector<pair<string, string>> FlatpakBackend::parseFlatpakRemotes(const string& o
 // Validation
 // ============================================================================
 
+// Compiled once at load time; the function-local static form pays a
+// thread-safe initialization guard check on every call.
+//
+// App IDs: reverse DNS format (e.g., org.gnome.Calculator), at least two
+// components separated by dots, each component non-empty and starting
+// with a letter followed by letters/digits/underscores/hyphens (no dots
+// inside a component, so "org..App" is rejected). Remote names:
+// alphanumeric, hyphens, underscores.
+// Security: both patterns also prevent command injection.
+static const regex kValidAppId("^[a-zA-Z][a-zA-Z0-9_-]*(\\.[a-zA-Z][a-zA-Z0-9_-]*)+$");
+static const regex kValidRemoteName("^[a-zA-Z][a-zA-Z0-9_-]*$");
+
 bool FlatpakBackend::isValidAppId(const string& appId) const
 {
-    // Flatpak app IDs: reverse DNS format (e.g., org.gnome.Calculator)
-    // At least two components separated by dots
-    // Each component: letters, digits, underscores, hyphens
     if (appId.empty() || appId.length() > 255) {
         return false;
     }
 
-    // Security: Prevent command injection
-    static const regex validId("^[a-zA-Z][a-zA-Z0-9._-]*(\\.[a-zA-Z][a-zA-Z0-9._-]*)+$");
-    return regex_match(appId, validId);
+    return regex_match(appId, kValidAppId);
 }
 
 bool FlatpakBackend::isValidRemoteName(const string& name) const
 {
-    // Remote names: alphanumeric, hyphens, underscores
     if (name.empty() || name.length() > 50) {
         return false;
     }
 
-    static const regex validName("^[a-zA-Z][a-zA-Z0-9_-]*$");
-    return regex_match(name, validName);
+    return regex_match(name, kValidRemoteName);
 }
 
 } // namespace PolySynaptic
@@ -19,9 +19,11 @@
 #define _FLATPAKBACKEND_H_
 
 #include "ipackagebackend.h"
+#include <map>
 #include <mutex>
 #include <set>
 #include <atomic>
+#include <chrono>
 
 namespace PolySynaptic {
 
@@ -173,6 +175,18 @@ public:
      */
     bool hasRemote(const string& remoteName);
 
+    // Validation (public so tests can exercise it directly)
+    bool isValidAppId(const string& appId) const;
+    bool isValidRemoteName(const string& name) const;
+
+    // Parsing helpers (public so tests can feed canned CLI output
+    // instead of forking a real flatpak process)
+    vector<PackageInfo> parseFlatpakSearch(const string& output);
+    vector<PackageInfo> parseFlatpakList(const string& output);
+    PackageInfo parseFlatpakInfo(const string& output, const string& appId);
+    vector<PackageInfo> parseFlatpakUpdate(const string& output);
+    vector<pair<string, string>> parseFlatpakRemotes(const string& output);
+
 private:
     mutable mutex _mutex;
     mutable std::atomic<bool> _availabilityChecked;
@@ -181,6 +195,20 @@ private:
     mutable string _version;
     mutable vector<string> _remotes;
 
+    // Installed app-id cache (guarded by _mutex). Lets getInstallStatus
+    // answer from one `flatpak list` instead of two `flatpak info` forks
+    // per package; kept in sync by install/remove and invalidated on
+    // cache refresh.
+    mutable set<string> _installedIds;
+    mutable bool _installedIdsValid;
+
+    // Per-app details cache (guarded by _mutex): UIs re-query the same
+    // app on hover/click/install and each miss costs one or more
+    // `flatpak info` forks. Cleared wholesale once it grows past the cap.
+    static constexpr int DETAILS_TTL_SECONDS = 60;
+    static constexpr size_t DETAILS_CACHE_MAX = 256;
+    mutable map<string, pair<chrono::steady_clock::time_point, PackageInfo>> _detailsCache;
+
     Scope _defaultScope;
     string _defaultRemote;
     int _timeoutSeconds;
@@ -197,22 +225,15 @@ private:
         const vector<string>& args,
         int timeoutSeconds = 0) const;
 
-    // Parsing helpers
-    vector<PackageInfo> parseFlatpakSearch(const string& output);
-    vector<PackageInfo> parseFlatpakList(const string& output);
-    PackageInfo parseFlatpakInfo(const string& output, const string& appId);
-    vector<PackageInfo> parseFlatpakUpdate(const string& output);
-    vector<pair<string, string>> parseFlatpakRemotes(const string& output);
-
-    // Validation
-    bool isValidAppId(const string& appId) const;
-    bool isValidRemoteName(const string& name) const;
-
     // Check availability (cached)
     void checkAvailability() const;
 
     // Refresh remotes cache
     void refreshRemotesCache() const;
+
+    // Installed app-id cache management
+    void loadInstalledIdsCache() const;
+    void invalidateInstalledIdsCache() const;
 };
 
 } // namespace PolySynaptic
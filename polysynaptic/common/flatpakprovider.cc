@@ -21,6 +21,27 @@
 
 namespace PolySynaptic {
 
+// Case-insensitive substring test. The needle must already be
+// lowercased; the haystack is compared in place, so filtering a large
+// installed list doesn't allocate a lowercase copy per package.
+static bool containsIgnoreCase(const std::string& haystack,
+                               const std::string& lowerNeedle)
+{
+    if (lowerNeedle.empty()) return true;
+    if (haystack.size() < lowerNeedle.size()) return false;
+
+    for (size_t i = 0; i + lowerNeedle.size() <= haystack.size(); i++) {
+        size_t j = 0;
+        while (j < lowerNeedle.size() &&
+               ::tolower(static_cast<unsigned char>(haystack[i + j])) ==
+                   lowerNeedle[j]) {
+            j++;
+        }
+        if (j == lowerNeedle.size()) return true;
+    }
+    return false;
+}
+
 // ============================================================================
 // Constructor
 // ============================================================================
@@ -125,15 +146,10 @@ std::vector<UnifiedPackage> FlatpakProvider::search(
                       lowerQuery.begin(), ::tolower);
 
         for (const auto& pkg : installed) {
-            std::string name = pkg.name;
-            std::transform(name.begin(), name.end(), name.begin(), ::tolower);
-
-            bool matches = (name.find(lowerQuery) != std::string::npos);
+            bool matches = containsIgnoreCase(pkg.name, lowerQuery);
 
             if (!matches && options.searchDescriptions) {
-                std::string desc = pkg.summary;
-                std::transform(desc.begin(), desc.end(), desc.begin(), ::tolower);
-                matches = (desc.find(lowerQuery) != std::string::npos);
+                matches = containsIgnoreCase(pkg.summary, lowerQuery);
             }
 
             if (matches) {
@@ -131,7 +131,7 @@ struct PackageInfo {
     // === Identification ===
     string id;                  // Unique identifier (backend-specific format)
     string name;                // Human-readable package name
-    BackendType backend;        // Source backend (APT/SNAP/FLATPAK)
+    BackendType backend = BackendType::UNKNOWN;  // Source backend (APT/SNAP/FLATPAK)
 
     // === Description ===
     string summary;             // One-line description/summary
@@ -140,7 +140,7 @@ struct PackageInfo {
     // === Versioning ===
     string version;             // Available/candidate version
     string installedVersion;    // Currently installed version (empty if not installed)
-    InstallStatus installStatus; // Current installation status
+    InstallStatus installStatus = InstallStatus::UNKNOWN;  // Current installation status
 
     // === Metadata ===
     string section;             // Category/section (e.g., "utils", "games")
@@ -149,8 +149,8 @@ struct PackageInfo {
     string license;             // License type (if available)
 
     // === Size Information ===
-    long downloadSize;          // Download size in bytes (0 if unknown)
-    long installedSize;         // Installed size in bytes (0 if unknown)
+    long downloadSize = 0;      // Download size in bytes (0 if unknown)
+    long installedSize = 0;     // Installed size in bytes (0 if unknown)
 
     // === Backend-Specific Data ===
     string origin;              // Package origin/repository
@@ -160,7 +160,7 @@ struct PackageInfo {
     string channel;             // Snap channel (stable/beta/edge)
     string confinement;         // Snap confinement (strict/classic/devmode)
     string publisher;           // Snap publisher name
-    bool isClassic;             // Requires --classic flag
+    bool isClassic = false;     // Requires --classic flag
 
     // === Flatpak-Specific ===
     string remote;              // Flatpak remote name (e.g., "flathub")
@@ -169,34 +169,19 @@ struct PackageInfo {
     string runtimeRef;          // Required runtime ref
 
     // === UI State ===
-    bool isMarkedForInstall;    // User has marked for installation
-    bool isMarkedForRemoval;    // User has marked for removal
-    bool isMarkedForUpgrade;    // User has marked for upgrade
-
-    // Default constructor
-    PackageInfo()
-        : backend(BackendType::UNKNOWN)
-        , installStatus(InstallStatus::UNKNOWN)
-        , downloadSize(0)
-        , installedSize(0)
-        , isClassic(false)
-        , isMarkedForInstall(false)
-        , isMarkedForRemoval(false)
-        , isMarkedForUpgrade(false)
-    {}
+    bool isMarkedForInstall = false;  // User has marked for installation
+    bool isMarkedForRemoval = false;  // User has marked for removal
+    bool isMarkedForUpgrade = false;  // User has marked for upgrade
+
+    // Defaults come from the in-class member initializers above, so the
+    // two constructors can't drift out of sync
+    PackageInfo() = default;
 
     // Convenience constructor with basic fields
     PackageInfo(const string& _id, const string& _name, BackendType _backend)
         : id(_id)
         , name(_name)
         , backend(_backend)
-        , installStatus(InstallStatus::UNKNOWN)
-        , downloadSize(0)
-        , installedSize(0)
-        , isClassic(false)
-        , isMarkedForInstall(false)
-        , isMarkedForRemoval(false)
-        , isMarkedForUpgrade(false)
     {}
 
     // Check if package is installed (any version)
@@ -227,12 +212,10 @@ struct PackageInfo {
  * Contains success/failure status along with any messages or errors.
  */
 struct OperationResult {
-    bool success;               // Whether operation succeeded
+    bool success = false;       // Whether operation succeeded
     string message;             // Human-readable message
     string errorDetails;        // Technical error details (for logging)
-    int exitCode;               // Process exit code (for CLI operations)
-
-    OperationResult() : success(false), exitCode(0) {}
+    int exitCode = 0;           // Process exit code (for CLI operations)
 
     static OperationResult Success(const string& msg = "") {
         OperationResult r;
@@ -274,20 +257,12 @@ using ProgressCallback = function<bool(double current, const string& message)>;
  * SearchOptions - Options for package search operations
  */
 struct SearchOptions {
-    string query;               // Search query string
-    bool searchNames;           // Search in package names
-    bool searchDescriptions;    // Search in descriptions
-    bool installedOnly;         // Only return installed packages
-    bool availableOnly;         // Only return non-installed packages
-    int maxResults;             // Maximum results to return (0 = unlimited)
-
-    SearchOptions()
-        : searchNames(true)
-        , searchDescriptions(true)
-        , installedOnly(false)
-        , availableOnly(false)
-        , maxResults(500)
-    {}
+    string query;                    // Search query string
+    bool searchNames = true;         // Search in package names
+    bool searchDescriptions = true;  // Search in descriptions
+    bool installedOnly = false;      // Only return installed packages
+    bool availableOnly = false;      // Only return non-installed packages
+    int maxResults = 500;            // Maximum results to return (0 = unlimited)
 };
 
 // ============================================================================
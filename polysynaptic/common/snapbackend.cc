@@ -13,10 +13,12 @@
 #include <unistd.h>
 #include <sys/wait.h>
 #include <sys/types.h>
+#include <sys/stat.h>
 #include <signal.h>
 #include <fcntl.h>
 #include <poll.h>
 
+#include <cstdlib>
 #include <cstring>
 #include <sstream>
 #include <regex>
@@ -24,6 +26,32 @@
 
 namespace PolySynaptic {
 
+// ============================================================================
+// Helpers
+// ============================================================================
+
+// Check whether a command exists by scanning $PATH with access(X_OK).
+// Much cheaper than forking `which`: a few stat-like syscalls instead of
+// fork + exec + wait.
+static bool commandInPath(const string& cmd)
+{
+    const char* pathEnv = getenv("PATH");
+    if (pathEnv == nullptr) {
+        return false;
+    }
+
+    istringstream iss(pathEnv);
+    string dir;
+    while (getline(iss, dir, ':')) {
+        if (dir.empty()) continue;
+        string candidate = dir + "/" + cmd;
+        if (access(candidate.c_str(), X_OK) == 0) {
+            return true;
+        }
+    }
+    return false;
+}
+
 // ============================================================================
 // Constructor / Destructor
 // ============================================================================
@@ -58,6 +86,27 @@ string SnapBackend::getUnavailableReason() const
 string SnapBackend::getVersion() const
 {
     checkAvailability();
+    if (!_isAvailable) {
+        return "";
+    }
+
+    // Probe lazily: most callers only need isAvailable(), so the
+    // `snap version` spawn is deferred until someone actually asks.
+    lock_guard<mutex> lock(_mutex);
+    if (_version.empty()) {
+        auto result = executeCommand({"snap", "version"}, 10);
+        if (result.success && result.exitCode == 0) {
+            // Parse first line: "snap    X.Y.Z"
+            istringstream iss(result.stdout);
+            string line;
+            if (getline(iss, line)) {
+                size_t pos = line.find_last_of(" \t");
+                if (pos != string::npos) {
+                    _version = line.substr(pos + 1);
+                }
+            }
+        }
+    }
     return _version;
 }
 
@@ -73,9 +122,8 @@ void SnapBackend::checkAvailability() const
     // Note: We set this to true AFTER initialization completes (at end of function)
     // to ensure all data is visible to other threads
 
-    // Check if snap command exists
-    auto result = executeCommand({"which", "snap"}, 5);
-    if (!result.success || result.exitCode != 0) {
+    // Check if snap command exists (PATH scan, no subprocess)
+    if (!commandInPath("snap")) {
         _isAvailable = false;
         _unavailableReason = "snap command not found. Install snapd to enable Snap support.";
         _availabilityChecked.store(true, std::memory_order_release);
@@ -90,20 +138,8 @@ void SnapBackend::checkAvailability() const
         return;
     }
 
-    // Get version
-    result = executeCommand({"snap", "version"}, 10);
-    if (result.success && result.exitCode == 0) {
-        // Parse first line: "snap    X.Y.Z"
-        istringstream iss(result.stdout);
-        string line;
-        if (getline(iss, line)) {
-            size_t pos = line.find_last_of(" \t");
-            if (pos != string::npos) {
-                _version = line.substr(pos + 1);
-            }
-        }
-    }
-
+    // Version is probed lazily in getVersion(); availability itself
+    // costs no subprocess spawns.
     _isAvailable = true;
     // Use release memory order to ensure all writes are visible
     _availabilityChecked.store(true, std::memory_order_release);
@@ -111,9 +147,14 @@ void SnapBackend::checkAvailability() const
 
 bool SnapBackend::isSnapdRunning() const
 {
-    // Check if snapd socket exists and is accessible
-    auto result = executeCommand({"snap", "list"}, 10);
-    return result.success && result.exitCode == 0;
+    // A running snapd always exposes its control socket; a stat is a
+    // single syscall, versus the fork + exec + store round-trip that
+    // `snap list` used to cost here.
+    struct stat st;
+    if (stat("/run/snapd.socket", &st) == 0 && S_ISSOCK(st.st_mode)) {
+        return true;
+    }
+    return stat("/var/run/snapd.socket", &st) == 0 && S_ISSOCK(st.st_mode);
 }
 
 string SnapBackend::getStoreUrl() const
@@ -176,18 +217,20 @@ vector<PackageInfo> SnapBackend::searchPackages(
         results.resize(options.maxResults);
     }
 
-    // Get installation status for each result
+    // Get installation status for each result. The merge only needs the
+    // installed version, so keep a name->version map instead of copying
+    // whole PackageInfo records that are immediately discarded.
     auto installed = getInstalledPackages(nullptr);
-    map<string, PackageInfo> installedMap;
-    for (const auto& pkg : installed) {
-        installedMap[pkg.name] = pkg;
+    map<string, string> installedVersions;
+    for (auto& pkg : installed) {
+        installedVersions[pkg.name] = std::move(pkg.installedVersion);
     }
 
     for (auto& pkg : results) {
-        auto it = installedMap.find(pkg.name);
-        if (it != installedMap.end()) {
+        auto it = installedVersions.find(pkg.name);
+        if (it != installedVersions.end()) {
             pkg.installStatus = InstallStatus::INSTALLED;
-            pkg.installedVersion = it->second.installedVersion;
+            pkg.installedVersion = it->second;
         }
     }
 
@@ -238,6 +281,17 @@ PackageInfo SnapBackend::getPackageDetails(const string& packageId)
         return info;
     }
 
+    // Serve repeated queries for the same snap from the details cache
+    {
+        lock_guard<mutex> lock(_mutex);
+        auto it = _detailsCache.find(packageId);
+        if (it != _detailsCache.end() &&
+            chrono::steady_clock::now() - it->second.first <
+                chrono::seconds(DETAILS_TTL_SECONDS)) {
+            return it->second.second;
+        }
+    }
+
     auto result = executeCommand({"snap", "info", packageId}, _timeoutSeconds);
 
     if (!result.success || result.exitCode != 0) {
@@ -245,6 +299,15 @@ PackageInfo SnapBackend::getPackageDetails(const string& packageId)
     }
 
     info = parseSnapInfo(result.stdout);
+
+    {
+        lock_guard<mutex> lock(_mutex);
+        if (_detailsCache.size() >= DETAILS_CACHE_MAX) {
+            _detailsCache.clear();
+        }
+        _detailsCache[packageId] = {chrono::steady_clock::now(), info};
+    }
+
     return info;
 }
 
@@ -280,6 +343,19 @@ vector<PackageInfo> SnapBackend::getUpgradablePackages(
         return results;
     }
 
+    // Serve from the short-TTL cache when fresh
+    {
+        lock_guard<mutex> lock(_mutex);
+        if (_upgradableCacheValid &&
+            chrono::steady_clock::now() - _upgradableCacheTime <
+                chrono::seconds(UPGRADABLE_TTL_SECONDS)) {
+            if (progress) {
+                progress(1.0, "Found " + to_string(_upgradableCache.size()) + " Snap updates");
+            }
+            return _upgradableCache;
+        }
+    }
+
     if (progress) {
         progress(0.1, "Checking for Snap updates...");
     }
@@ -295,6 +371,13 @@ vector<PackageInfo> SnapBackend::getUpgradablePackages(
         results = parseSnapRefreshList(result.stdout);
     }
 
+    {
+        lock_guard<mutex> lock(_mutex);
+        _upgradableCache = results;
+        _upgradableCacheTime = chrono::steady_clock::now();
+        _upgradableCacheValid = true;
+    }
+
     if (progress) {
         progress(1.0, "Found " + to_string(results.size()) + " Snap updates");
     }
@@ -302,6 +385,13 @@ vector<PackageInfo> SnapBackend::getUpgradablePackages(
     return results;
 }
 
+void SnapBackend::invalidateUpgradableCache() const
+{
+    lock_guard<mutex> lock(_mutex);
+    _upgradableCacheValid = false;
+    _detailsCache.clear();
+}
+
 // ============================================================================
 // Package Operations
 // ============================================================================
@@ -352,6 +442,7 @@ OperationResult SnapBackend::installSnap(
     }
 
     if (result.success && result.exitCode == 0) {
+        invalidateUpgradableCache();
         return OperationResult::Success("Successfully installed " + snapName);
     } else {
         return OperationResult::Failure(
@@ -395,6 +486,7 @@ OperationResult SnapBackend::removePackage(
     }
 
     if (result.success && result.exitCode == 0) {
+        invalidateUpgradableCache();
         return OperationResult::Success("Successfully removed " + packageId);
     } else {
         return OperationResult::Failure(
@@ -429,6 +521,7 @@ OperationResult SnapBackend::updatePackage(
     }
 
     if (result.success && result.exitCode == 0) {
+        invalidateUpgradableCache();
         return OperationResult::Success("Successfully updated " + packageId);
     } else {
         return OperationResult::Failure(
@@ -445,6 +538,7 @@ OperationResult SnapBackend::refreshCache(ProgressCallback progress)
     if (progress) {
         progress(1.0, "Snap store is always up-to-date");
     }
+    invalidateUpgradableCache();
     return OperationResult::Success("Snap store refreshed");
 }
 
@@ -517,6 +611,7 @@ OperationResult SnapBackend::switchChannel(
     auto result = executeCommand(sudoArgs, 60);
 
     if (result.success && result.exitCode == 0) {
+        invalidateUpgradableCache();
         return OperationResult::Success("Switched " + snapName + " to " + channel);
     } else {
         return OperationResult::Failure(
@@ -627,21 +722,19 @@ SnapBackend::CommandResult SnapBackend::executeCommand(
         int ret = poll(fds, 2, 100);  // 100ms poll timeout
 
         if (ret > 0) {
-            char buffer[4096];
+            char buffer[65536];  // large reads mean fewer read() wakeups for chatty commands
 
             if (fds[0].revents & POLLIN) {
-                ssize_t n = read(stdoutPipe[0], buffer, sizeof(buffer) - 1);
+                ssize_t n = read(stdoutPipe[0], buffer, sizeof(buffer));
                 if (n > 0) {
-                    buffer[n] = '\0';
-                    result.stdout += buffer;
+                    result.stdout.append(buffer, n);
                 }
             }
 
             if (fds[1].revents & POLLIN) {
-                ssize_t n = read(stderrPipe[0], buffer, sizeof(buffer) - 1);
+                ssize_t n = read(stderrPipe[0], buffer, sizeof(buffer));
                 if (n > 0) {
-                    buffer[n] = '\0';
-                    result.stderr += buffer;
+                    result.stderr.append(buffer, n);
                 }
             }
         }
@@ -651,15 +744,13 @@ SnapBackend::CommandResult SnapBackend::executeCommand(
         pid_t w = waitpid(pid, &status, WNOHANG);
         if (w > 0) {
             // Read any remaining data
-            char buffer[4096];
+            char buffer[65536];  // large reads mean fewer read() wakeups for chatty commands
             ssize_t n;
-            while ((n = read(stdoutPipe[0], buffer, sizeof(buffer) - 1)) > 0) {
-                buffer[n] = '\0';
-                result.stdout += buffer;
+            while ((n = read(stdoutPipe[0], buffer, sizeof(buffer))) > 0) {
+                result.stdout.append(buffer, n);
             }
-            while ((n = read(stderrPipe[0], buffer, sizeof(buffer) - 1)) > 0) {
-                buffer[n] = '\0';
-                result.stderr += buffer;
+            while ((n = read(stderrPipe[0], buffer, sizeof(buffer))) > 0) {
+                result.stderr.append(buffer, n);
             }
 
             if (WIFEXITED(status)) {
@@ -689,10 +780,40 @@ SnapBackend::CommandResult SnapBackend::executeCommand(
 // Parsing Helpers
 // ============================================================================
 
+// Scan the next whitespace-separated token starting at pos, advancing
+// pos past it. Returns an empty string once the line is exhausted. The
+// tabular parsers use this instead of building an istringstream per
+// line, which dominated their cost on large outputs.
+static string nextToken(const string& line, size_t& pos)
+{
+    while (pos < line.size() && (line[pos] == ' ' || line[pos] == '\t')) {
+        pos++;
+    }
+    size_t start = pos;
+    while (pos < line.size() && line[pos] != ' ' && line[pos] != '\t') {
+        pos++;
+    }
+    return line.substr(start, pos - start);
+}
+
+// Remainder of the line after pos, with leading whitespace trimmed
+static string restOfLine(const string& line, size_t pos)
+{
+    size_t start = line.find_first_not_of(" \t", pos);
+    if (start == string::npos) {
+        return "";
+    }
+    return line.substr(start);
+}
+
 vector<PackageInfo> SnapBackend::parseSnapFind(const string& output)
 {
     vector<PackageInfo> results;
 
+    // One slot per line is a slight overestimate (header row) but
+    // avoids repeated reallocation on large outputs
+    results.reserve(count(output.begin(), output.end(), '\n'));
+
     /*
      * snap find output format:
      * Name       Version   Publisher   Notes   Summary
@@ -704,9 +825,10 @@ vector<PackageInfo> SnapBackend::parseSnapFind(const string& output)
     bool headerSkipped = false;
 
     while (getline(iss, line)) {
-        // Skip header line
+        // Skip header line ("Name  Version  ..." always starts the column
+        // row, so a prefix compare beats scanning the whole line twice)
         if (!headerSkipped) {
-            if (line.find("Name") != string::npos && line.find("Version") != string::npos) {
+            if (line.compare(0, 4, "Name") == 0) {
                 headerSkipped = true;
             }
             continue;
@@ -716,29 +838,23 @@ vector<PackageInfo> SnapBackend::parseSnapFind(const string& output)
         if (line.empty()) continue;
 
         // Parse columns (space-separated, but summary can have spaces)
-        istringstream lineStream(line);
-        string name, version, publisher, notes;
-
-        lineStream >> name >> version >> publisher >> notes;
+        size_t pos = 0;
+        string name = nextToken(line, pos);
+        string version = nextToken(line, pos);
+        string publisher = nextToken(line, pos);
+        string notes = nextToken(line, pos);
 
         // Rest is summary
-        string summary;
-        getline(lineStream, summary);
-
-        // Trim leading spaces from summary
-        size_t start = summary.find_first_not_of(" \t");
-        if (start != string::npos) {
-            summary = summary.substr(start);
-        }
+        string summary = restOfLine(line, pos);
 
         if (!name.empty()) {
             PackageInfo info;
             info.backend = BackendType::SNAP;
             info.id = name;
-            info.name = name;
-            info.version = version;
-            info.publisher = publisher;
-            info.summary = summary;
+            info.name = std::move(name);
+            info.version = std::move(version);
+            info.publisher = std::move(publisher);
+            info.summary = std::move(summary);
             info.installStatus = InstallStatus::NOT_INSTALLED;
 
             // Check for classic confinement note
@@ -747,7 +863,7 @@ vector<PackageInfo> SnapBackend::parseSnapFind(const string& output)
                 info.confinement = "classic";
             }
 
-            results.push_back(info);
+            results.push_back(std::move(info));
         }
     }
 
@@ -758,6 +874,10 @@ vector<PackageInfo> SnapBackend::parseSnapList(const string& output)
 {
     vector<PackageInfo> results;
 
+    // One slot per line is a slight overestimate (header row) but
+    // avoids repeated reallocation on large outputs
+    results.reserve(count(output.begin(), output.end(), '\n'));
+
     /*
      * snap list output format:
      * Name        Version    Rev    Tracking       Publisher   Notes
@@ -770,7 +890,7 @@ vector<PackageInfo> SnapBackend::parseSnapList(const string& output)
 
     while (getline(iss, line)) {
         if (!headerSkipped) {
-            if (line.find("Name") != string::npos && line.find("Rev") != string::npos) {
+            if (line.compare(0, 4, "Name") == 0) {
                 headerSkipped = true;
             }
             continue;
@@ -778,24 +898,26 @@ vector<PackageInfo> SnapBackend::parseSnapList(const string& output)
 
         if (line.empty()) continue;
 
-        istringstream lineStream(line);
-        string name, version, rev, tracking, publisher, notes;
-
-        lineStream >> name >> version >> rev >> tracking >> publisher;
+        size_t pos = 0;
+        string name = nextToken(line, pos);
+        string version = nextToken(line, pos);
+        string rev = nextToken(line, pos);
+        string tracking = nextToken(line, pos);
+        string publisher = nextToken(line, pos);
 
         // Rest is notes
-        getline(lineStream, notes);
+        string notes = restOfLine(line, pos);
 
         if (!name.empty()) {
             PackageInfo info;
             info.backend = BackendType::SNAP;
             info.id = name;
-            info.name = name;
+            info.name = std::move(name);
             info.version = version;
-            info.installedVersion = version;
+            info.installedVersion = std::move(version);
             info.installStatus = InstallStatus::INSTALLED;
-            info.publisher = publisher;
-            info.channel = tracking;
+            info.publisher = std::move(publisher);
+            info.channel = std::move(tracking);
 
             // Parse notes for confinement
             if (notes.find("classic") != string::npos) {
@@ -807,7 +929,7 @@ vector<PackageInfo> SnapBackend::parseSnapList(const string& output)
                 info.confinement = "strict";
             }
 
-            results.push_back(info);
+            results.push_back(std::move(info));
         }
     }
 
@@ -909,6 +1031,10 @@ vector<PackageInfo> SnapBackend::parseSnapRefreshList(const string& output)
 {
     vector<PackageInfo> results;
 
+    // One slot per line is a slight overestimate (header row) but
+    // avoids repeated reallocation on large outputs
+    results.reserve(count(output.begin(), output.end(), '\n'));
+
     /*
      * snap refresh --list output:
      * Name        Version  Rev   Publisher   Notes
@@ -921,31 +1047,32 @@ vector<PackageInfo> SnapBackend::parseSnapRefreshList(const string& output)
 
     while (getline(iss, line)) {
         if (!headerSkipped) {
-            if (line.find("Name") != string::npos || line.find("All snaps up to date") != string::npos) {
+            if (line.compare(0, 9, "All snaps") == 0) {
+                return results;  // "All snaps up to date", no updates
+            }
+            if (line.compare(0, 4, "Name") == 0) {
                 headerSkipped = true;
-                if (line.find("All snaps up to date") != string::npos) {
-                    return results;  // No updates
-                }
             }
             continue;
         }
 
         if (line.empty()) continue;
 
-        istringstream lineStream(line);
-        string name, version, rev, publisher;
-
-        lineStream >> name >> version >> rev >> publisher;
+        size_t pos = 0;
+        string name = nextToken(line, pos);
+        string version = nextToken(line, pos);
+        string rev = nextToken(line, pos);
+        string publisher = nextToken(line, pos);
 
         if (!name.empty()) {
             PackageInfo info;
             info.backend = BackendType::SNAP;
             info.id = name;
-            info.name = name;
-            info.version = version;
+            info.name = std::move(name);
+            info.version = std::move(version);
             info.installStatus = InstallStatus::UPDATE_AVAILABLE;
-            info.publisher = publisher;
-            results.push_back(info);
+            info.publisher = std::move(publisher);
+            results.push_back(std::move(info));
         }
     }
 
@@ -958,14 +1085,32 @@ vector<PackageInfo> SnapBackend::parseSnapRefreshList(const string& output)
 
 bool SnapBackend::isValidSnapName(const string& name) const
 {
-    // Snap names: lowercase letters, digits, hyphens (not at start/end)
-    // Security: Prevent command injection
+    // Snap names: lowercase letters, digits, hyphens; must start with a
+    // letter and must not end with a hyphen. A direct character scan is
+    // far cheaper than the regex this used to be, and the check runs
+    // for every package id that reaches the backend.
+    // Security: also prevents command injection.
     if (name.empty() || name.length() > 40) {
         return false;
     }
 
-    static const regex validName("^[a-z][a-z0-9-]*[a-z0-9]$|^[a-z]$");
-    return regex_match(name, validName);
+    if (name.front() < 'a' || name.front() > 'z') {
+        return false;
+    }
+    if (name.back() == '-') {
+        return false;
+    }
+
+    for (char c : name) {
+        bool ok = (c >= 'a' && c <= 'z') ||
+                  (c >= '0' && c <= '9') ||
+                  c == '-';
+        if (!ok) {
+            return false;
+        }
+    }
+
+    return true;
 }
 
 } // namespace PolySynaptic
@@ -19,6 +19,7 @@
 #define _SNAPBACKEND_H_
 
 #include "ipackagebackend.h"
+#include <map>
 #include <mutex>
 #include <chrono>
 #include <atomic>
@@ -146,6 +147,16 @@ public:
      */
     void setTimeout(int seconds) { _timeoutSeconds = seconds; }
 
+    // Validation (public so tests can exercise it directly)
+    bool isValidSnapName(const string& name) const;
+
+    // Parsing helpers (public so tests can feed canned CLI output
+    // instead of forking a real snap process)
+    PackageInfo parseSnapInfo(const string& output);
+    vector<PackageInfo> parseSnapFind(const string& output);
+    vector<PackageInfo> parseSnapList(const string& output);
+    vector<PackageInfo> parseSnapRefreshList(const string& output);
+
 private:
     mutable mutex _mutex;           // Thread safety lock
     mutable std::atomic<bool> _availabilityChecked;
@@ -154,6 +165,22 @@ private:
     mutable string _version;
     int _timeoutSeconds;
 
+    // Upgradable-list cache with a short TTL (guarded by _mutex), so a
+    // burst of getInstallStatus calls doesn't respawn
+    // `snap refresh --list` per package. Invalidated by operations that
+    // change the installed set.
+    static constexpr int UPGRADABLE_TTL_SECONDS = 30;
+    mutable vector<PackageInfo> _upgradableCache;
+    mutable chrono::steady_clock::time_point _upgradableCacheTime;
+    mutable bool _upgradableCacheValid = false;
+
+    // Per-package details cache (guarded by _mutex): UIs re-query the
+    // same snap on hover/click/install and each miss costs a
+    // `snap info` spawn. Cleared wholesale once it grows past the cap.
+    static constexpr int DETAILS_TTL_SECONDS = 60;
+    static constexpr size_t DETAILS_CACHE_MAX = 256;
+    mutable map<string, pair<chrono::steady_clock::time_point, PackageInfo>> _detailsCache;
+
     // CLI execution helpers
     struct CommandResult {
         bool success;
@@ -166,17 +193,11 @@ private:
         const vector<string>& args,
         int timeoutSeconds = 0) const;
 
-    // Parsing helpers
-    PackageInfo parseSnapInfo(const string& output);
-    vector<PackageInfo> parseSnapFind(const string& output);
-    vector<PackageInfo> parseSnapList(const string& output);
-    vector<PackageInfo> parseSnapRefreshList(const string& output);
-
-    // Validation
-    bool isValidSnapName(const string& name) const;
-
     // Check availability (cached)
     void checkAvailability() const;
+
+    // Drop the upgradable-list and details caches
+    void invalidateUpgradableCache() const;
 };
 
 } // namespace PolySynaptic
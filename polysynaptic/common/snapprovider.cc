@@ -22,6 +22,27 @@
 
 namespace PolySynaptic {
 
+// Case-insensitive substring test. The needle must already be
+// lowercased; the haystack is compared in place, so filtering a large
+// installed list doesn't allocate a lowercase copy per package.
+static bool containsIgnoreCase(const std::string& haystack,
+                               const std::string& lowerNeedle)
+{
+    if (lowerNeedle.empty()) return true;
+    if (haystack.size() < lowerNeedle.size()) return false;
+
+    for (size_t i = 0; i + lowerNeedle.size() <= haystack.size(); i++) {
+        size_t j = 0;
+        while (j < lowerNeedle.size() &&
+               ::tolower(static_cast<unsigned char>(haystack[i + j])) ==
+                   lowerNeedle[j]) {
+            j++;
+        }
+        if (j == lowerNeedle.size()) return true;
+    }
+    return false;
+}
+
 // ============================================================================
 // Constructor
 // ============================================================================
@@ -61,25 +82,25 @@ ProviderStatus SnapProvider::getStatus() const {
     }
 
     // Get snap version and counts
-    auto result = const_cast<SnapProvider*>(this)->executeCommand(
-        "snap version 2>/dev/null | head -1");
+    auto result = const_cast<SnapProvider*>(this)->executeCommandArgs(
+        {"snap", "version"}, 30000);
 
     if (result.exitCode == 0) {
-        status.version = result.stdout;
-        // Remove newline
-        while (!status.version.empty() &&
-               (status.version.back() == '\n' || status.version.back() == '\r')) {
+        // First line is "snap  X.Y.Z"
+        status.version = result.stdout.substr(0, result.stdout.find('\n'));
+        while (!status.version.empty() && status.version.back() == '\r') {
             status.version.pop_back();
         }
     }
 
-    // Count installed snaps
-    result = const_cast<SnapProvider*>(this)->executeCommand(
-        "snap list 2>/dev/null | tail -n +2 | wc -l");
+    // Count installed snaps (first output line is the header)
+    result = const_cast<SnapProvider*>(this)->executeCommandArgs(
+        {"snap", "list"}, 30000);
     if (result.exitCode == 0) {
-        try {
-            status.installedCount = std::stoi(result.stdout);
-        } catch (...) {}
+        long lines = std::count(result.stdout.begin(), result.stdout.end(), '\n');
+        if (lines > 0) {
+            status.installedCount = static_cast<int>(lines - 1);
+        }
     }
 
     return status;
@@ -117,10 +138,7 @@ std::vector<UnifiedPackage> SnapProvider::search(
                       lowerQuery.begin(), ::tolower);
 
         for (const auto& pkg : installed) {
-            std::string name = pkg.name;
-            std::transform(name.begin(), name.end(), name.begin(), ::tolower);
-
-            if (name.find(lowerQuery) != std::string::npos) {
+            if (containsIgnoreCase(pkg.name, lowerQuery)) {
                 filtered.push_back(pkg);
             }
 
@@ -136,8 +154,8 @@ std::vector<UnifiedPackage> SnapProvider::search(
         return {};
     }
 
-    std::string cmd = "snap find '" + query + "' 2>/dev/null";
-    auto result = executeCommand(cmd, 60000);  // 60s timeout for searches
+    auto result = executeCommandArgs(
+        {"snap", "find", query}, 60000);  // 60s timeout for searches
 
     if (result.exitCode != 0) {
         LOG(LogLevel::WARN)
@@ -175,7 +193,7 @@ std::vector<UnifiedPackage> SnapProvider::search(
 }
 
 std::vector<UnifiedPackage> SnapProvider::getInstalled() {
-    auto result = executeCommand("snap list 2>/dev/null", 30000);
+    auto result = executeCommandArgs({"snap", "list"}, 30000);
 
     if (result.exitCode != 0) {
         LOG(LogLevel::WARN)
@@ -191,7 +209,7 @@ std::vector<UnifiedPackage> SnapProvider::getInstalled() {
 }
 
 std::vector<UnifiedPackage> SnapProvider::getUpdatable() {
-    auto result = executeCommand("snap refresh --list 2>/dev/null", 30000);
+    auto result = executeCommandArgs({"snap", "refresh", "--list"}, 30000);
 
     if (result.exitCode != 0) {
         // No updates available returns non-zero
@@ -209,8 +227,7 @@ std::optional<UnifiedPackage> SnapProvider::getPackageDetails(
         return std::nullopt;
     }
 
-    std::string cmd = "snap info '" + packageId + "' 2>/dev/null";
-    auto result = executeCommand(cmd, 30000);
+    auto result = executeCommandArgs({"snap", "info", packageId}, 30000);
 
     if (result.exitCode != 0) {
         return std::nullopt;
@@ -239,14 +256,14 @@ OperationResult SnapProvider::install(
             "Invalid snap name: " + packageId, "", -1);
     }
 
-    std::string cmd = "snap install '" + packageId + "'";
+    std::vector<std::string> args = {"snap", "install", packageId};
 
     // Add channel if specified
     if (!options.version.empty()) {
-        cmd += " --channel=" + options.version;
+        args.push_back("--channel=" + options.version);
     }
 
-    auto result = executeCommand(cmd, 300000);  // 5 minute timeout
+    auto result = executeCommandArgs(args, 300000);  // 5 minute timeout
 
     if (result.exitCode != 0) {
         LOG(LogLevel::ERROR)
@@ -290,13 +307,13 @@ OperationResult SnapProvider::remove(
             "Invalid snap name: " + packageId, "", -1);
     }
 
-    std::string cmd = "snap remove '" + packageId + "'";
+    std::vector<std::string> args = {"snap", "remove", packageId};
 
     if (options.purge) {
-        cmd += " --purge";
+        args.push_back("--purge");
     }
 
-    auto result = executeCommand(cmd, 120000);  // 2 minute timeout
+    auto result = executeCommandArgs(args, 120000);  // 2 minute timeout
 
     if (result.exitCode != 0) {
         LOG(LogLevel::ERROR)
@@ -337,8 +354,8 @@ OperationResult SnapProvider::update(const std::string& packageId) {
             "Invalid snap name: " + packageId, "", -1);
     }
 
-    std::string cmd = "snap refresh '" + packageId + "'";
-    auto result = executeCommand(cmd, 300000);  // 5 minute timeout
+    auto result = executeCommandArgs(
+        {"snap", "refresh", packageId}, 300000);  // 5 minute timeout
 
     if (result.exitCode != 0) {
         LOG(LogLevel::ERROR)
@@ -430,8 +447,8 @@ OperationResult SnapProvider::switchChannel(
         return OperationResult::Failure("Invalid snap name", "", -1);
     }
 
-    std::string cmd = "snap switch '" + snapName + "' --channel=" + channel;
-    auto result = executeCommand(cmd, 30000);
+    auto result = executeCommandArgs(
+        {"snap", "switch", snapName, "--channel=" + channel}, 30000);
 
     if (result.exitCode != 0) {
         return OperationResult::Failure(
@@ -450,12 +467,19 @@ OperationResult SnapProvider::connectPlug(
     const std::string& targetSnap,
     const std::string& slot)
 {
-    std::string cmd = "snap connect " + snap + ":" + plug;
+    // Plug and slot names share the snap-name charset, so the same
+    // validator applies; reject before paying for the fork
+    if (!isValidSnapName(snap) || !isValidSnapName(plug) ||
+        (!targetSnap.empty() && !isValidSnapName(targetSnap))) {
+        return OperationResult::Failure("Invalid snap or plug name", "", -1);
+    }
+
+    std::vector<std::string> args = {"snap", "connect", snap + ":" + plug};
     if (!targetSnap.empty()) {
-        cmd += " " + targetSnap + ":" + slot;
+        args.push_back(targetSnap + ":" + slot);
     }
 
-    auto result = executeCommand(cmd, 30000);
+    auto result = executeCommandArgs(args, 30000);
 
     if (result.exitCode != 0) {
         return OperationResult::Failure(
@@ -471,8 +495,12 @@ OperationResult SnapProvider::disconnectPlug(
     const std::string& snap,
     const std::string& plug)
 {
-    std::string cmd = "snap disconnect " + snap + ":" + plug;
-    auto result = executeCommand(cmd, 30000);
+    if (!isValidSnapName(snap) || !isValidSnapName(plug)) {
+        return OperationResult::Failure("Invalid snap or plug name", "", -1);
+    }
+
+    auto result = executeCommandArgs(
+        {"snap", "disconnect", snap + ":" + plug}, 30000);
 
     if (result.exitCode != 0) {
         return OperationResult::Failure(
@@ -489,8 +517,12 @@ std::vector<std::pair<std::string, bool>> SnapProvider::getConnections(
 {
     std::vector<std::pair<std::string, bool>> connections;
 
-    std::string cmd = "snap connections '" + snapName + "' 2>/dev/null";
-    auto result = executeCommand(cmd, 10000);
+    if (!isValidSnapName(snapName)) {
+        return connections;
+    }
+
+    auto result = executeCommandArgs(
+        {"snap", "connections", snapName}, 10000);
 
     if (result.exitCode != 0) {
         return connections;
@@ -531,8 +563,7 @@ OperationResult SnapProvider::enable(const std::string& snapName) {
         return OperationResult::Failure("Invalid snap name", "", -1);
     }
 
-    std::string cmd = "snap enable '" + snapName + "'";
-    auto result = executeCommand(cmd, 30000);
+    auto result = executeCommandArgs({"snap", "enable", snapName}, 30000);
 
     if (result.exitCode != 0) {
         return OperationResult::Failure(
@@ -549,8 +580,7 @@ OperationResult SnapProvider::disable(const std::string& snapName) {
         return OperationResult::Failure("Invalid snap name", "", -1);
     }
 
-    std::string cmd = "snap disable '" + snapName + "'";
-    auto result = executeCommand(cmd, 30000);
+    auto result = executeCommandArgs({"snap", "disable", snapName}, 30000);
 
     if (result.exitCode != 0) {
         return OperationResult::Failure(
@@ -567,8 +597,7 @@ OperationResult SnapProvider::revert(const std::string& snapName) {
         return OperationResult::Failure("Invalid snap name", "", -1);
     }
 
-    std::string cmd = "snap revert '" + snapName + "'";
-    auto result = executeCommand(cmd, 120000);
+    auto result = executeCommandArgs({"snap", "revert", snapName}, 120000);
 
     if (result.exitCode != 0) {
         return OperationResult::Failure(
@@ -588,11 +617,8 @@ OperationResult SnapProvider::holdUpdates(
         return OperationResult::Failure("Invalid snap name", "", -1);
     }
 
-    std::string cmd = hold
-        ? "snap refresh --hold '" + snapName + "'"
-        : "snap refresh --unhold '" + snapName + "'";
-
-    auto result = executeCommand(cmd, 30000);
+    auto result = executeCommandArgs(
+        {"snap", "refresh", hold ? "--hold" : "--unhold", snapName}, 30000);
 
     if (result.exitCode != 0) {
         return OperationResult::Failure(
@@ -786,21 +812,6 @@ SnapProvider::CommandResult SnapProvider::executeCommandArgs(
     return result;
 }
 
-// Legacy shell-based command execution (DEPRECATED - use executeCommandArgs)
-// Kept for backward compatibility with existing callers
-SnapProvider::CommandResult SnapProvider::executeCommand(
-    const std::string& command,
-    int timeoutMs)
-{
-    // For safety, parse the command and use the arg-based version
-    // This is a simple tokenizer - doesn't handle all shell syntax
-    std::vector<std::string> args;
-    args.push_back("/bin/sh");
-    args.push_back("-c");
-    args.push_back(command);
-    return executeCommandArgs(args, timeoutMs);
-}
-
 std::vector<UnifiedPackage> SnapProvider::parseSnapList(
     const std::string& output)
 {
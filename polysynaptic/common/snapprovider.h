@@ -177,9 +177,6 @@ private:
     // Safe argument-based execution (no shell - prevents command injection)
     CommandResult executeCommandArgs(const std::vector<std::string>& args,
                                       int timeoutMs = 30000);
-    // Legacy shell-based execution (DEPRECATED - wraps executeCommandArgs)
-    CommandResult executeCommand(const std::string& command,
-                                  int timeoutMs = 30000);
 
     // Parse snap list output
     std::vector<UnifiedPackage> parseSnapList(const std::string& output);
@@ -24,11 +24,17 @@
 #include <map>
 #include <chrono>
 #include <mutex>
+#include <shared_mutex>
+#include <thread>
+#include <condition_variable>
+#include <atomic>
 #include <fstream>
 #include <sstream>
 #include <functional>
 #include <memory>
 #include <iomanip>
+#include <iostream>
+#include <cstdio>
 #include <ctime>
 #include <deque>
 
@@ -66,10 +72,10 @@ inline const char* logLevelToString(LogLevel level) {
  */
 struct LogEntry {
     // Timestamp
-    std::chrono::system_clock::time_point timestamp;
+    std::chrono::system_clock::time_point timestamp = std::chrono::system_clock::now();
 
     // Level
-    LogLevel level;
+    LogLevel level = LogLevel::INFO;
 
     // Message
     std::string message;
@@ -91,110 +97,182 @@ struct LogEntry {
     // Arbitrary key-value data
     std::map<std::string, std::string> fields;
 
-    // Default constructor
-    LogEntry()
-        : timestamp(std::chrono::system_clock::now())
-        , level(LogLevel::INFO)
-    {}
-
     // Convert to JSON string
+    //
+    // Built by appending to a preallocated string rather than through an
+    // ostringstream: this runs for every entry on every sink, and the
+    // stream machinery (construction, locale, formatting) dominated its
+    // cost.
     std::string toJson() const {
-        std::ostringstream json;
-        json << "{";
+        std::string json;
+        json.reserve(192 + message.size() + rawStderr.size());
 
         // Timestamp
         auto time = std::chrono::system_clock::to_time_t(timestamp);
         auto ms = std::chrono::duration_cast<std::chrono::milliseconds>(
             timestamp.time_since_epoch()) % 1000;
-        json << "\"timestamp\":\"";
-        json << std::put_time(std::gmtime(&time), "%Y-%m-%dT%H:%M:%S");
-        json << "." << std::setfill('0') << std::setw(3) << ms.count() << "Z\"";
+        // The seconds-resolution prefix is identical for every entry
+        // logged within the same second, so cache the gmtime/strftime
+        // result per thread and only the millisecond suffix is formatted
+        // per call
+        static thread_local time_t cachedTime = 0;
+        static thread_local char cachedStamp[40];
+        static thread_local size_t cachedLen = 0;
+        if (time != cachedTime || cachedLen == 0) {
+            std::tm tmBuf;
+            gmtime_r(&time, &tmBuf);
+            cachedLen = std::strftime(cachedStamp, sizeof(cachedStamp),
+                                      "%Y-%m-%dT%H:%M:%S", &tmBuf);
+            cachedTime = time;
+        }
+        json += "{\"timestamp\":\"";
+        json.append(cachedStamp, cachedLen);
+        char msBuf[8];
+        std::snprintf(msBuf, sizeof(msBuf), ".%03dZ\"",
+                      static_cast<int>(ms.count()));
+        json += msBuf;
 
         // Level
-        json << ",\"level\":\"" << logLevelToString(level) << "\"";
+        json += ",\"level\":\"";
+        json += logLevelToString(level);
+        json += '"';
 
         // Message
-        json << ",\"message\":\"" << escapeJson(message) << "\"";
+        appendStringField(json, "message", message);
 
         // Optional fields
         if (!provider.empty())
-            json << ",\"provider\":\"" << escapeJson(provider) << "\"";
+            appendStringField(json, "provider", provider);
         if (!operation.empty())
-            json << ",\"operation\":\"" << escapeJson(operation) << "\"";
+            appendStringField(json, "operation", operation);
         if (!packageId.empty())
-            json << ",\"packageId\":\"" << escapeJson(packageId) << "\"";
+            appendStringField(json, "packageId", packageId);
         if (!component.empty())
-            json << ",\"component\":\"" << escapeJson(component) << "\"";
+            appendStringField(json, "component", component);
         if (!errorCode.empty())
-            json << ",\"errorCode\":\"" << escapeJson(errorCode) << "\"";
+            appendStringField(json, "errorCode", errorCode);
         if (!rawStderr.empty())
-            json << ",\"stderr\":\"" << escapeJson(rawStderr) << "\"";
-        if (exitCode != 0)
-            json << ",\"exitCode\":" << exitCode;
-        if (duration.count() > 0)
-            json << ",\"durationMs\":" << duration.count();
+            appendStringField(json, "stderr", rawStderr);
+        if (exitCode != 0) {
+            json += ",\"exitCode\":";
+            json += std::to_string(exitCode);
+        }
+        if (duration.count() > 0) {
+            json += ",\"durationMs\":";
+            json += std::to_string(duration.count());
+        }
 
         // Custom fields
         for (const auto& [key, value] : fields) {
-            json << ",\"" << escapeJson(key) << "\":\"" << escapeJson(value) << "\"";
+            json += ",\"";
+            json += escapeJson(key);
+            json += "\":\"";
+            json += escapeJson(value);
+            json += '"';
         }
 
-        json << "}";
-        return json.str();
+        json += '}';
+        return json;
     }
 
     // Human-readable format for UI
+    // Same construction style as toJson: straight string appends, no
+    // stream machinery on a per-entry path
     std::string toReadable() const {
-        std::ostringstream ss;
+        std::string out;
+        out.reserve(64 + message.size());
 
         auto time = std::chrono::system_clock::to_time_t(timestamp);
-        ss << std::put_time(std::localtime(&time), "%H:%M:%S");
+        std::tm tmBuf;
+        localtime_r(&time, &tmBuf);
+        char stamp[16];
+        size_t stampLen = std::strftime(stamp, sizeof(stamp), "%H:%M:%S", &tmBuf);
+        out.append(stamp, stampLen);
 
-        ss << " [" << logLevelToString(level) << "]";
+        out += " [";
+        out += logLevelToString(level);
+        out += ']';
 
         if (!provider.empty()) {
-            ss << " [" << provider << "]";
+            out += " [";
+            out += provider;
+            out += ']';
         }
 
         if (!operation.empty()) {
-            ss << " " << operation;
+            out += ' ';
+            out += operation;
         }
 
         if (!packageId.empty()) {
-            ss << " (" << packageId << ")";
+            out += " (";
+            out += packageId;
+            out += ')';
         }
 
-        ss << ": " << message;
+        out += ": ";
+        out += message;
 
         if (duration.count() > 0) {
-            ss << " (" << duration.count() << "ms)";
+            out += " (";
+            out += std::to_string(duration.count());
+            out += "ms)";
         }
 
-        return ss.str();
+        return out;
     }
 
 private:
+    static void appendStringField(std::string& json,
+                                  const char* key,
+                                  const std::string& value) {
+        json += ",\"";
+        json += key;
+        json += "\":\"";
+        json += escapeJson(value);
+        json += '"';
+    }
+
+    static bool needsJsonEscape(char c) {
+        return c == '"' || c == '\\' || static_cast<unsigned char>(c) < 0x20;
+    }
+
     static std::string escapeJson(const std::string& s) {
-        std::ostringstream escaped;
-        for (char c : s) {
+        // Fast path: typical values (package ids, operation names) need
+        // no escaping, so check with one scan before building anything
+        size_t i = 0;
+        while (i < s.size() && !needsJsonEscape(s[i])) {
+            i++;
+        }
+        if (i == s.size()) {
+            return s;
+        }
+
+        std::string escaped;
+        escaped.reserve(s.size() + 8);
+        escaped.append(s, 0, i);
+        for (; i < s.size(); i++) {
+            char c = s[i];
             switch (c) {
-                case '"':  escaped << "\\\""; break;
-                case '\\': escaped << "\\\\"; break;
-                case '\b': escaped << "\\b"; break;
-                case '\f': escaped << "\\f"; break;
-                case '\n': escaped << "\\n"; break;
-                case '\r': escaped << "\\r"; break;
-                case '\t': escaped << "\\t"; break;
+                case '"':  escaped += "\\\""; break;
+                case '\\': escaped += "\\\\"; break;
+                case '\b': escaped += "\\b"; break;
+                case '\f': escaped += "\\f"; break;
+                case '\n': escaped += "\\n"; break;
+                case '\r': escaped += "\\r"; break;
+                case '\t': escaped += "\\t"; break;
                 default:
-                    if (c < 0x20) {
-                        escaped << "\\u" << std::hex << std::setfill('0')
-                                << std::setw(4) << static_cast<int>(c);
+                    if (static_cast<unsigned char>(c) < 0x20) {
+                        char buf[8];
+                        std::snprintf(buf, sizeof(buf), "\\u%04x",
+                                      static_cast<unsigned>(static_cast<unsigned char>(c)));
+                        escaped += buf;
                     } else {
-                        escaped << c;
+                        escaped += c;
                     }
             }
         }
-        return escaped.str();
+        return escaped;
     }
 };
 
@@ -209,6 +287,15 @@ class LogSink {
 public:
     virtual ~LogSink() = default;
     virtual void write(const LogEntry& entry) = 0;
+
+    // Write a batch of entries. Sinks that can amortize per-entry
+    // overhead (e.g. FileSink) override this; the default just loops.
+    virtual void writeBatch(const std::vector<LogEntry>& entries) {
+        for (const auto& entry : entries) {
+            write(entry);
+        }
+    }
+
     virtual void flush() {}
 };
 
@@ -218,6 +305,11 @@ public:
 class FileSink : public LogSink {
 public:
     explicit FileSink(const std::string& path) : _path(path) {
+        // Install a large stream buffer before open() (it is ignored
+        // afterwards): bursts of log entries then reach the OS as a few
+        // big writes instead of one small write per entry
+        _buffer.resize(64 * 1024);
+        _file.rdbuf()->pubsetbuf(_buffer.data(), _buffer.size());
         _file.open(path, std::ios::app);
     }
 
@@ -228,12 +320,33 @@ public:
     }
 
     void write(const LogEntry& entry) override {
+        // Serialize outside the lock; only the stream write needs it
+        std::string line = entry.toJson();
+        line += '\n';
+        std::lock_guard<std::mutex> lock(_mutex);
+        if (_file.is_open()) {
+            _file.write(line.data(), line.size());
+        }
+    }
+
+    void writeBatch(const std::vector<LogEntry>& entries) override {
+        if (entries.empty()) {
+            return;
+        }
+        // One stream write for the whole batch instead of one per entry
+        std::string block;
+        for (const auto& entry : entries) {
+            block += entry.toJson();
+            block += '\n';
+        }
+        std::lock_guard<std::mutex> lock(_mutex);
         if (_file.is_open()) {
-            _file << entry.toJson() << "\n";
+            _file.write(block.data(), block.size());
         }
     }
 
     void flush() override {
+        std::lock_guard<std::mutex> lock(_mutex);
         if (_file.is_open()) {
             _file.flush();
         }
@@ -241,7 +354,9 @@ public:
 
 private:
     std::string _path;
+    std::vector<char> _buffer;  // Backs _file's stream buffer; must outlive it
     std::ofstream _file;
+    std::mutex _mutex;  // Guards _file; entries may arrive from any thread
 };
 
 /**
@@ -250,8 +365,16 @@ private:
 class ConsoleSink : public LogSink {
 public:
     void write(const LogEntry& entry) override {
-        std::cerr << entry.toReadable() << std::endl;
+        // Format outside the lock; the lock keeps concurrent writers
+        // from interleaving partial lines on stderr
+        std::string line = entry.toReadable();
+        line += '\n';
+        std::lock_guard<std::mutex> lock(_mutex);
+        std::cerr << line << std::flush;
     }
+
+private:
+    std::mutex _mutex;  // Guards stderr output; entries may arrive from any thread
 };
 
 /**
@@ -262,15 +385,26 @@ public:
     explicit MemorySink(size_t maxEntries = 1000) : _maxEntries(maxEntries) {}
 
     void write(const LogEntry& entry) override {
-        std::lock_guard<std::mutex> lock(_mutex);
+        std::unique_lock<std::shared_mutex> lock(_mutex);
         _entries.push_back(entry);
         while (_entries.size() > _maxEntries) {
             _entries.pop_front();
         }
     }
 
+    void writeBatch(const std::vector<LogEntry>& entries) override {
+        // One lock acquisition for the whole batch
+        std::unique_lock<std::shared_mutex> lock(_mutex);
+        for (const auto& entry : entries) {
+            _entries.push_back(entry);
+        }
+        while (_entries.size() > _maxEntries) {
+            _entries.pop_front();
+        }
+    }
+
     std::vector<LogEntry> getEntries(size_t count = 0) const {
-        std::lock_guard<std::mutex> lock(_mutex);
+        std::shared_lock<std::shared_mutex> lock(_mutex);
         if (count == 0 || count >= _entries.size()) {
             return std::vector<LogEntry>(_entries.begin(), _entries.end());
         }
@@ -283,7 +417,7 @@ public:
         const std::string& provider = "",
         const std::string& operation = "") const
     {
-        std::lock_guard<std::mutex> lock(_mutex);
+        std::shared_lock<std::shared_mutex> lock(_mutex);
         std::vector<LogEntry> filtered;
         for (const auto& entry : _entries) {
             if (entry.level < minLevel) continue;
@@ -295,19 +429,21 @@ public:
     }
 
     void clear() {
-        std::lock_guard<std::mutex> lock(_mutex);
+        std::unique_lock<std::shared_mutex> lock(_mutex);
         _entries.clear();
     }
 
     size_t size() const {
-        std::lock_guard<std::mutex> lock(_mutex);
+        std::shared_lock<std::shared_mutex> lock(_mutex);
         return _entries.size();
     }
 
 private:
     size_t _maxEntries;
     std::deque<LogEntry> _entries;
-    mutable std::mutex _mutex;
+    // Reader/writer lock: the debug panel polls getEntries* while
+    // logging threads append, so readers shouldn't serialize each other
+    mutable std::shared_mutex _mutex;
 };
 
 // ============================================================================
@@ -341,16 +477,86 @@ public:
         return _minLevel;
     }
 
+    // Route entries through a single background writer thread. When
+    // enabled, log() only enqueues and the writer drains the queue in
+    // coalesced batches through writeBatch, so callers never wait on
+    // sink I/O. Off by default; flush() and shutdown drain the queue.
+    void setAsync(bool enabled) {
+        std::lock_guard<std::mutex> control(_writerControlMutex);
+        if (enabled == _asyncEnabled.load()) return;
+        if (enabled) {
+            {
+                std::lock_guard<std::mutex> qlock(_queueMutex);
+                _stopWriter = false;
+            }
+            _writer = std::thread(&Logger::writerLoop, this);
+            _asyncEnabled = true;
+        } else {
+            _asyncEnabled = false;
+            {
+                std::lock_guard<std::mutex> qlock(_queueMutex);
+                _stopWriter = true;
+            }
+            _queueCv.notify_all();
+            _writer.join();
+        }
+    }
+
     // Log an entry
     void log(const LogEntry& entry) {
         if (entry.level < _minLevel) return;
 
-        std::lock_guard<std::mutex> lock(_mutex);
-        for (auto& sink : _sinks) {
+        if (_asyncEnabled) {
+            {
+                std::lock_guard<std::mutex> qlock(_queueMutex);
+                _queue.push_back(entry);
+            }
+            _queueCv.notify_one();
+            return;
+        }
+
+        // Snapshot the sink list under the lock, then write outside it:
+        // a slow sink (disk stall in FileSink) must not block every other
+        // logging thread. The sinks are shared_ptrs so a snapshot stays
+        // valid even if addSink races with us, and each sink guards its
+        // own state.
+        std::vector<std::shared_ptr<LogSink>> sinks;
+        {
+            std::lock_guard<std::mutex> lock(_mutex);
+            sinks = _sinks;
+        }
+        for (auto& sink : sinks) {
             sink->write(entry);
         }
     }
 
+    // Log a batch of entries in one pass. Each sink sees the batch
+    // once (single lock acquisition, single file write) instead of
+    // being hit entry by entry.
+    void log(const std::vector<LogEntry>& entries) {
+        std::vector<LogEntry> filtered;
+        filtered.reserve(entries.size());
+        for (const auto& entry : entries) {
+            if (entry.level >= _minLevel) {
+                filtered.push_back(entry);
+            }
+        }
+        if (filtered.empty()) return;
+
+        if (_asyncEnabled) {
+            {
+                std::lock_guard<std::mutex> qlock(_queueMutex);
+                _queue.insert(_queue.end(),
+                              std::make_move_iterator(filtered.begin()),
+                              std::make_move_iterator(filtered.end()));
+            }
+            _queueCv.notify_one();
+            return;
+        }
+
+        dispatchBatch(filtered);
+    }
+
     // Convenience methods
     void debug(const std::string& msg) { log(LogLevel::DEBUG, msg); }
     void info(const std::string& msg) { log(LogLevel::INFO, msg); }
@@ -365,8 +571,22 @@ public:
         log(entry);
     }
 
-    // Flush all sinks
+    // Flush all sinks (draining the async queue first if enabled)
     void flush() {
+        if (_asyncEnabled) {
+            // Hand queued entries to the sinks ourselves; whichever of
+            // this path and the writer grabs the queue first gets the
+            // entries, so nothing is written twice
+            std::vector<LogEntry> pending;
+            {
+                std::lock_guard<std::mutex> qlock(_queueMutex);
+                pending.swap(_queue);
+            }
+            if (!pending.empty()) {
+                dispatchBatch(pending);
+            }
+        }
+
         std::lock_guard<std::mutex> lock(_mutex);
         for (auto& sink : _sinks) {
             sink->flush();
@@ -386,13 +606,59 @@ private:
         _sinks.push_back(std::make_shared<ConsoleSink>());
     }
 
+    ~Logger() {
+        // Stop the writer (draining the queue) if async mode was left on
+        setAsync(false);
+    }
+
     Logger(const Logger&) = delete;
     Logger& operator=(const Logger&) = delete;
 
+    // Snapshot sinks, then hand them the batch outside the lock
+    void dispatchBatch(const std::vector<LogEntry>& batch) {
+        std::vector<std::shared_ptr<LogSink>> sinks;
+        {
+            std::lock_guard<std::mutex> lock(_mutex);
+            sinks = _sinks;
+        }
+        for (auto& sink : sinks) {
+            sink->writeBatch(batch);
+        }
+    }
+
+    void writerLoop() {
+        std::vector<LogEntry> batch;
+        std::unique_lock<std::mutex> lock(_queueMutex);
+        for (;;) {
+            _queueCv.wait(lock, [this] { return _stopWriter || !_queue.empty(); });
+            if (_queue.empty()) {
+                if (_stopWriter) return;
+                continue;
+            }
+            // Take everything queued so far in one swap; entries that
+            // piled up while the sinks were busy coalesce into a single
+            // writeBatch
+            batch.swap(_queue);
+            lock.unlock();
+            dispatchBatch(batch);
+            batch.clear();
+            lock.lock();
+        }
+    }
+
     std::mutex _mutex;
     std::vector<std::shared_ptr<LogSink>> _sinks;
     std::shared_ptr<MemorySink> _memorySink;
     LogLevel _minLevel;
+
+    // Async writer state
+    std::atomic<bool> _asyncEnabled{false};
+    bool _stopWriter = false;           // Guarded by _queueMutex
+    std::vector<LogEntry> _queue;       // Guarded by _queueMutex
+    std::mutex _queueMutex;
+    std::condition_variable _queueCv;
+    std::mutex _writerControlMutex;
+    std::thread _writer;
 };
 
 // ============================================================================
@@ -490,13 +756,23 @@ public:
         , _start(std::chrono::steady_clock::now())
     {}
 
+    // Commit-or-rollback semantics: the destructor emits a completion
+    // entry at the configured level unless fail() was called, in which
+    // case it emits an ERROR entry carrying the failure details
     ~ScopedLogTimer() {
         auto end = std::chrono::steady_clock::now();
         auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end - _start);
 
-        LogBuilder(_level)
-            .message(_operation + " completed")
-            .operation(_operation)
+        LogBuilder builder(_failed ? LogLevel::ERROR : _level);
+        if (_failed) {
+            builder.message(_operation + " failed: " + _error);
+            if (!_stderr.empty()) {
+                builder.stderr(_stderr);
+            }
+        } else {
+            builder.message(_operation + " completed");
+        }
+        builder.operation(_operation)
             .provider(_provider)
             .package(_packageId)
             .duration(duration)
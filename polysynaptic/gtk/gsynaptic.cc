@@ -410,6 +410,15 @@ int main(int argc, char **argv)
 #endif
 #endif
 
+   // Answer -h/--help before gtk_init_check: printing usage should not
+   // require a display connection or any of the startup work below
+   for (int i = 1; i < argc; i++) {
+      if (strcmp(argv[i], "-h") == 0 || strcmp(argv[i], "--help") == 0) {
+         CommandLine CmdL(Args, _config);
+         ShowHelp(CmdL);
+      }
+   }
+
    if (!gtk_init_check(&argc, &argv)) {
       std::cout <<
          _("Failed to initialize GTK.\n") <<
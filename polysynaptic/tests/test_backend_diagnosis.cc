@@ -17,6 +17,9 @@
 #include <sstream>
 #include <chrono>
 #include <cstdlib>
+#include <map>
+
+#include <unistd.h>
 
 #include "ipackagebackend.h"
 #include "snapbackend.h"
@@ -69,15 +72,44 @@ void printHeader(const string& title) {
 // System Command Tests
 // ============================================================================
 
+// Cached binary presence check: one $PATH walk per command for the whole
+// run instead of forking `which` through the shell each time. Lets the
+// snap/flatpak sections skip early on systems without those tools.
+bool commandAvailable(const string& cmd) {
+    static map<string, bool> cache;
+    auto it = cache.find(cmd);
+    if (it != cache.end()) return it->second;
+
+    bool found = false;
+    const char* pathEnv = getenv("PATH");
+    if (pathEnv) {
+        istringstream iss(pathEnv);
+        string dir;
+        while (getline(iss, dir, ':')) {
+            if (dir.empty()) continue;
+            if (access((dir + "/" + cmd).c_str(), X_OK) == 0) {
+                found = true;
+                break;
+            }
+        }
+    }
+    cache[cmd] = found;
+    return found;
+}
+
 bool testCommand(const string& cmd, const string& description) {
     diagInfo("Testing: " + description);
     diagInfo("Command: " + cmd);
 
-    int result = system((cmd + " > /tmp/polysynaptic_test_out.txt 2>&1").c_str());
+    // Per-process output file so concurrent runs don't clobber each other
+    static const string outPath =
+        "/tmp/polysynaptic_test_out." + to_string(getpid()) + ".txt";
+
+    int result = system((cmd + " > " + outPath + " 2>&1").c_str());
     int exitCode = WEXITSTATUS(result);
 
     // Read output
-    FILE* f = fopen("/tmp/polysynaptic_test_out.txt", "r");
+    FILE* f = fopen(outPath.c_str(), "r");
     string output;
     if (f) {
         char buffer[4096];
@@ -86,10 +118,12 @@ bool testCommand(const string& cmd, const string& description) {
         }
         fclose(f);
     }
+    unlink(outPath.c_str());
 
-    // Truncate output for display
+    // Truncate output for display (resize in place, no substr copy)
     if (output.length() > 500) {
-        output = output.substr(0, 500) + "...(truncated)";
+        output.resize(500);
+        output += "...(truncated)";
     }
 
     cout << "  Exit code: " << exitCode << endl;
@@ -107,10 +141,11 @@ bool testCommand(const string& cmd, const string& description) {
 void diagnoseSnap() {
     printHeader("SNAP BACKEND DIAGNOSTICS");
 
-    // Test 1: Check if snap command exists
+    // Test 1: Check if snap command exists (skip the whole section early
+    // so we don't pay subprocess timeouts on systems without snapd)
     diagInfo("Step 1: Checking if 'snap' command exists");
-    if (!testCommand("which snap", "Check snap binary location")) {
-        diagFail("snap command not found. Install snapd package.");
+    if (!commandAvailable("snap")) {
+        diagWarn("snap command not found - skipping Snap diagnostics. Install snapd package.");
         return;
     }
     diagPass("snap command found");
@@ -189,7 +224,14 @@ void diagnoseSnap() {
 
         cout << "  Search results:" << endl;
         for (const auto& pkg : searchResults) {
-            cout << "    - " << pkg.name << ": " << pkg.summary.substr(0, 50) << endl;
+            cout << "    - " << pkg.name << ": ";
+            // Clamp long summaries without allocating a truncated copy
+            if (pkg.summary.size() > 50) {
+                cout.write(pkg.summary.data(), 50);
+            } else {
+                cout << pkg.summary;
+            }
+            cout << endl;
         }
     }
 }
@@ -201,10 +243,11 @@ void diagnoseSnap() {
 void diagnoseFlatpak() {
     printHeader("FLATPAK BACKEND DIAGNOSTICS");
 
-    // Test 1: Check if flatpak command exists
+    // Test 1: Check if flatpak command exists (skip the whole section
+    // early so we don't pay subprocess timeouts on systems without it)
     diagInfo("Step 1: Checking if 'flatpak' command exists");
-    if (!testCommand("which flatpak", "Check flatpak binary location")) {
-        diagFail("flatpak command not found. Install flatpak package.");
+    if (!commandAvailable("flatpak")) {
+        diagWarn("flatpak command not found - skipping Flatpak diagnostics. Install flatpak package.");
         return;
     }
     diagPass("flatpak command found");
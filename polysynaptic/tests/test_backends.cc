@@ -49,24 +49,34 @@ ostream& operator<<(ostream& os, FlatpakBackend::Scope scope) {
 
 int g_testsPassed = 0;
 int g_testsFailed = 0;
+int g_testsSkipped = 0;
+
+struct TestCase {
+    const char* name;
+    void (*func)();
+    bool slow;
+};
+
+// Function-local static avoids the static initialization order fiasco
+vector<TestCase>& testRegistry() {
+    static vector<TestCase> registry;
+    return registry;
+}
 
-#define TEST(name) \
+#define TEST_IMPL(name, isSlow) \
     void test_##name(); \
-    struct Test_##name { \
-        Test_##name() { \
-            cout << "Running test: " << #name << "... "; \
-            try { \
-                test_##name(); \
-                cout << "PASSED" << endl; \
-                g_testsPassed++; \
-            } catch (const exception& e) { \
-                cout << "FAILED: " << e.what() << endl; \
-                g_testsFailed++; \
-            } \
-        } \
-    } test_instance_##name; \
+    struct Register_##name { \
+        Register_##name() { testRegistry().push_back({#name, test_##name, isSlow}); } \
+    } register_instance_##name; \
     void test_##name()
 
+#define TEST(name) TEST_IMPL(name, false)
+
+// Slow tests fork real CLI processes (snap/flatpak availability probes).
+// They are skipped by default so the common developer loop stays fast;
+// run them with --slow.
+#define TEST_SLOW(name) TEST_IMPL(name, true)
+
 #define ASSERT_TRUE(x) \
     if (!(x)) throw runtime_error(string("Assertion failed: ") + #x)
 
@@ -83,6 +93,26 @@ int g_testsFailed = 0;
 #define ASSERT_NE(a, b) \
     if ((a) == (b)) throw runtime_error(string("Assertion failed: ") + #a + " != " + #b)
 
+// Shared backend instances for tests that only exercise pure helpers
+// (validators, parsers). Tests that mutate backend state construct
+// their own instance so they stay order-independent.
+AptBackend& sharedAptBackend() {
+    // No lister: only the lister-independent helpers (validation) may be
+    // exercised through this instance
+    static AptBackend backend(nullptr);
+    return backend;
+}
+
+SnapBackend& sharedSnapBackend() {
+    static SnapBackend backend;
+    return backend;
+}
+
+FlatpakBackend& sharedFlatpakBackend() {
+    static FlatpakBackend backend;
+    return backend;
+}
+
 // ============================================================================
 // PackageInfo Tests
 // ============================================================================
@@ -322,12 +352,25 @@ TEST(TransactionResult_GetSummary) {
 // ============================================================================
 
 TEST(SnapBackend_ValidSnapNames) {
-    SnapBackend backend;
+    SnapBackend& backend = sharedSnapBackend();
 
-    // These would need to be tested with isValidSnapName being public
-    // For now, test that creation works
     ASSERT_EQ(backend.getType(), BackendType::SNAP);
     ASSERT_EQ(backend.getName(), "Snap");
+
+    // Valid names: lowercase letters, digits and hyphens, must start
+    // with a letter and not end with a hyphen
+    ASSERT_TRUE(backend.isValidSnapName("firefox"));
+    ASSERT_TRUE(backend.isValidSnapName("gnome-calculator"));
+    ASSERT_TRUE(backend.isValidSnapName("core22"));
+    ASSERT_TRUE(backend.isValidSnapName("a"));
+
+    // Invalid names
+    ASSERT_FALSE(backend.isValidSnapName(""));
+    ASSERT_FALSE(backend.isValidSnapName("Firefox"));       // uppercase
+    ASSERT_FALSE(backend.isValidSnapName("9cat"));          // starts with digit
+    ASSERT_FALSE(backend.isValidSnapName("trailing-"));     // ends with hyphen
+    ASSERT_FALSE(backend.isValidSnapName("has space"));
+    ASSERT_FALSE(backend.isValidSnapName("under_score"));
 }
 
 // ============================================================================
@@ -335,10 +378,202 @@ TEST(SnapBackend_ValidSnapNames) {
 // ============================================================================
 
 TEST(FlatpakBackend_ValidAppIds) {
-    FlatpakBackend backend;
+    FlatpakBackend& backend = sharedFlatpakBackend();
 
     ASSERT_EQ(backend.getType(), BackendType::FLATPAK);
     ASSERT_EQ(backend.getName(), "Flatpak");
+
+    // Table-driven: reverse-DNS style with at least two components
+    struct Case {
+        const char* appId;
+        bool valid;
+    };
+    static const Case cases[] = {
+        {"org.gnome.Calculator",   true},
+        {"com.spotify.Client",     true},
+        {"io.github.some-app.App", true},
+        {"a.b",                    true},
+        {"",                       false},  // empty
+        {"single",                 false},  // no dot
+        {"1org.gnome.App",         false},  // starts with digit
+        {"org..App",               false},  // empty component
+        {"org.gnome App",          false},  // whitespace
+        {"org.gnome.App;rm",       false},  // shell metacharacter
+    };
+
+    for (const auto& c : cases) {
+        if (backend.isValidAppId(c.appId) != c.valid) {
+            throw runtime_error(string("isValidAppId(\"") + c.appId + "\") != " +
+                                (c.valid ? "true" : "false"));
+        }
+    }
+}
+
+TEST(FlatpakBackend_ValidAppIds_Batch) {
+    FlatpakBackend& backend = sharedFlatpakBackend();
+
+    // Sweep a generated batch through the validator; catches accidental
+    // per-call state or pathological regex behavior at volume
+    for (int i = 0; i < 500; i++) {
+        string id = "org.example.App" + to_string(i);
+        ASSERT_TRUE(backend.isValidAppId(id));
+    }
+
+    for (int i = 0; i < 500; i++) {
+        string id = to_string(i) + ".example.App";  // leading digit
+        ASSERT_FALSE(backend.isValidAppId(id));
+    }
+}
+
+TEST(FlatpakBackend_ValidRemoteNames) {
+    FlatpakBackend& backend = sharedFlatpakBackend();
+
+    ASSERT_TRUE(backend.isValidRemoteName("flathub"));
+    ASSERT_TRUE(backend.isValidRemoteName("flathub-beta"));
+
+    ASSERT_FALSE(backend.isValidRemoteName(""));
+    ASSERT_FALSE(backend.isValidRemoteName("bad remote"));
+    ASSERT_FALSE(backend.isValidRemoteName("semi;colon"));
+}
+
+// ============================================================================
+// Injection Rejection Tests
+// ============================================================================
+
+// Shell-metacharacter payloads that must never reach executeCommand
+static const char* const kInjectionPayloads[] = {
+    "foo; rm -rf /",
+    "foo && reboot",
+    "foo | cat /etc/passwd",
+    "foo`id`",
+    "foo$(id)",
+    "foo\nbar",
+    "../../../etc/passwd",
+    "foo'bar",
+    "foo\"bar",
+    "foo>out",
+};
+
+TEST(Validators_RejectInjectionPayloads) {
+    AptBackend& aptBackend = sharedAptBackend();
+    SnapBackend& snapBackend = sharedSnapBackend();
+    FlatpakBackend& flatpakBackend = sharedFlatpakBackend();
+
+    for (const char* payload : kInjectionPayloads) {
+        if (aptBackend.isValidPackageName(payload)) {
+            throw runtime_error(string("isValidPackageName accepted: ") + payload);
+        }
+        if (snapBackend.isValidSnapName(payload)) {
+            throw runtime_error(string("isValidSnapName accepted: ") + payload);
+        }
+        if (flatpakBackend.isValidAppId(payload)) {
+            throw runtime_error(string("isValidAppId accepted: ") + payload);
+        }
+        if (flatpakBackend.isValidRemoteName(payload)) {
+            throw runtime_error(string("isValidRemoteName accepted: ") + payload);
+        }
+    }
+}
+
+// ============================================================================
+// FlatpakBackend Parsing Tests (canned CLI output, no subprocess)
+// ============================================================================
+
+TEST(FlatpakBackend_ParseSearch) {
+    FlatpakBackend& backend = sharedFlatpakBackend();
+
+    string output =
+        "org.gnome.Calculator\tCalculator\tPerform calculations\t42.1\tflathub\n"
+        "org.mozilla.firefox\tFirefox\tWeb browser\t120.0\tflathub\n";
+
+    auto results = backend.parseFlatpakSearch(output);
+    ASSERT_EQ(results.size(), 2u);
+    ASSERT_EQ(results[0].id, "org.gnome.Calculator");
+    ASSERT_EQ(results[0].name, "Calculator");
+    ASSERT_EQ(results[0].summary, "Perform calculations");
+    ASSERT_EQ(results[0].version, "42.1");
+    ASSERT_EQ(results[0].remote, "flathub");
+    ASSERT_EQ(results[0].backend, BackendType::FLATPAK);
+    ASSERT_EQ(results[0].installStatus, InstallStatus::NOT_INSTALLED);
+    ASSERT_EQ(results[1].id, "org.mozilla.firefox");
+}
+
+TEST(FlatpakBackend_ParseSearch_MalformedLines) {
+    FlatpakBackend& backend = sharedFlatpakBackend();
+
+    // Lines with too few columns or no content are skipped
+    string output =
+        "\n"
+        "only-one-column\n"
+        "two\tcolumns\n"
+        "org.gnome.Calculator\tCalculator\tPerform calculations\t42.1\tflathub\n";
+
+    auto results = backend.parseFlatpakSearch(output);
+    ASSERT_EQ(results.size(), 1u);
+    ASSERT_EQ(results[0].id, "org.gnome.Calculator");
+}
+
+TEST(FlatpakBackend_ParseList) {
+    FlatpakBackend& backend = sharedFlatpakBackend();
+
+    string output =
+        "org.gnome.Calculator\tCalculator\t42.1\tstable\tflathub\t98.7 MB\n";
+
+    auto results = backend.parseFlatpakList(output);
+    ASSERT_EQ(results.size(), 1u);
+    ASSERT_EQ(results[0].id, "org.gnome.Calculator");
+    ASSERT_EQ(results[0].installedVersion, "42.1");
+    ASSERT_EQ(results[0].branch, "stable");
+    ASSERT_EQ(results[0].remote, "flathub");
+    ASSERT_EQ(results[0].installStatus, InstallStatus::INSTALLED);
+}
+
+TEST(FlatpakBackend_ParseInfo) {
+    FlatpakBackend& backend = sharedFlatpakBackend();
+
+    string output =
+        "ID: org.gnome.Calculator\n"
+        "Ref: app/org.gnome.Calculator/x86_64/stable\n"
+        "Arch: x86_64\n"
+        "Branch: stable\n"
+        "Origin: flathub\n"
+        "Installed: 98.7 MB\n"
+        "Version: 42.1\n";
+
+    auto info = backend.parseFlatpakInfo(output, "org.gnome.Calculator");
+    ASSERT_EQ(info.id, "org.gnome.Calculator");
+    ASSERT_EQ(info.ref, "app/org.gnome.Calculator/x86_64/stable");
+    ASSERT_EQ(info.architecture, "x86_64");
+    ASSERT_EQ(info.branch, "stable");
+    ASSERT_EQ(info.remote, "flathub");
+    ASSERT_EQ(info.version, "42.1");
+    ASSERT_EQ(info.installStatus, InstallStatus::INSTALLED);
+}
+
+TEST(FlatpakBackend_ParseUpdate) {
+    FlatpakBackend& backend = sharedFlatpakBackend();
+
+    string output =
+        "org.gnome.Calculator\tCalculator\t42.2\tstable\tflathub\t98.7 MB\n";
+
+    auto results = backend.parseFlatpakUpdate(output);
+    ASSERT_EQ(results.size(), 1u);
+    ASSERT_EQ(results[0].installStatus, InstallStatus::UPDATE_AVAILABLE);
+}
+
+TEST(FlatpakBackend_ParseRemotes) {
+    FlatpakBackend& backend = sharedFlatpakBackend();
+
+    string output =
+        "Name\tURL\n"
+        "flathub\thttps://dl.flathub.org/repo/\n"
+        "flathub-beta\thttps://dl.flathub.org/beta-repo/\n";
+
+    auto remotes = backend.parseFlatpakRemotes(output);
+    ASSERT_EQ(remotes.size(), 2u);
+    ASSERT_EQ(remotes[0].first, "flathub");
+    ASSERT_EQ(remotes[0].second, "https://dl.flathub.org/repo/");
+    ASSERT_EQ(remotes[1].first, "flathub-beta");
 }
 
 TEST(FlatpakBackend_DefaultScope) {
@@ -359,11 +594,113 @@ TEST(FlatpakBackend_DefaultRemote) {
     ASSERT_EQ(backend.getDefaultRemote(), "custom");
 }
 
+// ============================================================================
+// SnapBackend Parser Tests (canned CLI output, no snap process needed)
+// ============================================================================
+
+TEST(SnapBackend_ParseFind) {
+    SnapBackend& backend = sharedSnapBackend();
+
+    string output =
+        "Name       Version   Publisher   Notes    Summary\n"
+        "hello      2.10      canonical*  -        GNU Hello, the \"hello world\" snap\n"
+        "code       1.85.0    vscode*     classic  Code editing. Redefined.\n";
+
+    auto results = backend.parseSnapFind(output);
+    ASSERT_EQ(results.size(), 2u);
+    ASSERT_EQ(results[0].id, "hello");
+    ASSERT_EQ(results[0].name, "hello");
+    ASSERT_EQ(results[0].version, "2.10");
+    ASSERT_EQ(results[0].publisher, "canonical*");
+    ASSERT_EQ(results[0].summary, "GNU Hello, the \"hello world\" snap");
+    ASSERT_EQ(results[0].backend, BackendType::SNAP);
+    ASSERT_EQ(results[0].installStatus, InstallStatus::NOT_INSTALLED);
+    ASSERT_FALSE(results[0].isClassic);
+    ASSERT_TRUE(results[1].isClassic);
+    ASSERT_EQ(results[1].confinement, "classic");
+}
+
+TEST(SnapBackend_ParseList) {
+    SnapBackend& backend = sharedSnapBackend();
+
+    string output =
+        "Name    Version   Rev   Tracking       Publisher   Notes\n"
+        "core20  20231123  2105  latest/stable  canonical*  base\n"
+        "code    1.85.0    147   latest/stable  vscode*     classic\n";
+
+    auto results = backend.parseSnapList(output);
+    ASSERT_EQ(results.size(), 2u);
+    ASSERT_EQ(results[0].id, "core20");
+    ASSERT_EQ(results[0].installedVersion, "20231123");
+    ASSERT_EQ(results[0].channel, "latest/stable");
+    ASSERT_EQ(results[0].installStatus, InstallStatus::INSTALLED);
+    ASSERT_EQ(results[0].confinement, "strict");
+    ASSERT_TRUE(results[1].isClassic);
+}
+
+TEST(SnapBackend_ParseInfo) {
+    SnapBackend& backend = sharedSnapBackend();
+
+    string output =
+        "name:        hello\n"
+        "summary:     GNU Hello, the \"hello world\" snap\n"
+        "publisher:   Canonical*\n"
+        "store-url:   https://snapcraft.io/hello\n"
+        "license:     GPL-3.0+\n"
+        "description: |\n"
+        "  GNU hello prints a friendly greeting.\n"
+        "tracking:    latest/stable\n"
+        "installed:   2.10 (29) 98kB -\n";
+
+    auto info = backend.parseSnapInfo(output);
+    ASSERT_EQ(info.id, "hello");
+    ASSERT_EQ(info.summary, "GNU Hello, the \"hello world\" snap");
+    ASSERT_EQ(info.publisher, "Canonical*");
+    ASSERT_EQ(info.homepage, "https://snapcraft.io/hello");
+    ASSERT_EQ(info.license, "GPL-3.0+");
+    ASSERT_EQ(info.channel, "latest/stable");
+    ASSERT_EQ(info.installedVersion, "2.10");
+    ASSERT_EQ(info.installStatus, InstallStatus::INSTALLED);
+}
+
+TEST(SnapBackend_ParseInfo_NotInstalled) {
+    SnapBackend& backend = sharedSnapBackend();
+
+    string output =
+        "name:     hello\n"
+        "summary:  GNU Hello, the \"hello world\" snap\n";
+
+    auto info = backend.parseSnapInfo(output);
+    ASSERT_EQ(info.id, "hello");
+    ASSERT_EQ(info.installStatus, InstallStatus::NOT_INSTALLED);
+}
+
+TEST(SnapBackend_ParseRefreshList) {
+    SnapBackend& backend = sharedSnapBackend();
+
+    string output =
+        "Name     Version  Rev   Publisher  Notes\n"
+        "firefox  123.0    3234  mozilla*   -\n";
+
+    auto results = backend.parseSnapRefreshList(output);
+    ASSERT_EQ(results.size(), 1u);
+    ASSERT_EQ(results[0].id, "firefox");
+    ASSERT_EQ(results[0].version, "123.0");
+    ASSERT_EQ(results[0].installStatus, InstallStatus::UPDATE_AVAILABLE);
+}
+
+TEST(SnapBackend_ParseRefreshList_UpToDate) {
+    SnapBackend& backend = sharedSnapBackend();
+
+    auto results = backend.parseSnapRefreshList("All snaps up to date.\n");
+    ASSERT_TRUE(results.empty());
+}
+
 // ============================================================================
 // BackendManager Tests (without real backends)
 // ============================================================================
 
-TEST(BackendManager_Creation) {
+TEST_SLOW(BackendManager_Creation) {
     BackendManager manager(nullptr);
 
     // Without a lister, APT backend shouldn't be available
@@ -371,7 +708,7 @@ TEST(BackendManager_Creation) {
     ASSERT_TRUE(statuses.size() >= 2);  // At least Snap and Flatpak
 }
 
-TEST(BackendManager_EnableDisable) {
+TEST_SLOW(BackendManager_EnableDisable) {
     BackendManager manager(nullptr);
 
     manager.setBackendEnabled(BackendType::SNAP, false);
@@ -381,7 +718,7 @@ TEST(BackendManager_EnableDisable) {
     ASSERT_TRUE(manager.isBackendEnabled(BackendType::SNAP));
 }
 
-TEST(BackendManager_TransactionQueue) {
+TEST_SLOW(BackendManager_TransactionQueue) {
     BackendManager manager(nullptr);
 
     ASSERT_FALSE(manager.hasQueuedOperations());
@@ -401,13 +738,51 @@ TEST(BackendManager_TransactionQueue) {
 
 int main(int argc, char** argv)
 {
+    bool listOnly = false;
+    bool runSlow = false;
+    for (int i = 1; i < argc; i++) {
+        string arg = argv[i];
+        if (arg == "--list") {
+            listOnly = true;
+        } else if (arg == "--slow") {
+            runSlow = true;
+        } else {
+            cerr << "Usage: " << argv[0] << " [--list] [--slow]" << endl;
+            return 2;
+        }
+    }
+
+    if (listOnly) {
+        for (const auto& test : testRegistry()) {
+            cout << test.name << (test.slow ? " [slow]" : "") << endl;
+        }
+        return 0;
+    }
+
     cout << "=== PolySynaptic Backend Tests ===" << endl << endl;
 
-    // Tests are run automatically by TEST macro constructors
+    for (const auto& test : testRegistry()) {
+        if (test.slow && !runSlow) {
+            g_testsSkipped++;
+            continue;
+        }
+        cout << "Running test: " << test.name << "... ";
+        try {
+            test.func();
+            cout << "PASSED" << endl;
+            g_testsPassed++;
+        } catch (const exception& e) {
+            cout << "FAILED: " << e.what() << endl;
+            g_testsFailed++;
+        }
+    }
 
     cout << endl << "=== Test Results ===" << endl;
     cout << "Passed: " << g_testsPassed << endl;
     cout << "Failed: " << g_testsFailed << endl;
+    if (g_testsSkipped > 0) {
+        cout << "Skipped: " << g_testsSkipped << " (slow; re-run with --slow)" << endl;
+    }
 
     return g_testsFailed > 0 ? 1 : 0;
 }